@@ -1,49 +1,141 @@
 from __future__ import annotations
+import re
+import numpy as np
 import pandas as pd
+try:
+    import numexpr as _numexpr
+except Exception:
+    _numexpr = None
+
+# HubSpot lifecycle stages that earn the lifecycle boost.
+_LIFECYCLE_STAGES = frozenset({"opportunity", "customer", "marketingqualifiedlead", "salesqualifiedlead"})
+_LIFECYCLE_RE = re.compile("|".join(sorted(_LIFECYCLE_STAGES)), re.IGNORECASE)
 
 def _col(df: pd.DataFrame, name: str, default: str = "") -> pd.Series:
-    """Return a string series for column `name`, or a default-filled series if missing."""
+    """Return a string series for column `name`, or a default-filled series if missing.
+
+    Object/string columns are returned as-is (no copy); other dtypes are cast.
+    """
     if name in df.columns:
-        return df[name].astype(str)
-    return pd.Series([default] * len(df))
+        s = df[name]
+        if s.dtype == object or isinstance(s.dtype, pd.StringDtype):
+            return s
+        return s.astype(str)
+    return pd.Series(default, index=df.index, dtype="string")
+
+def _combine_score(he: np.ndarray, ho: np.ndarray, lb: np.ndarray, rs: np.ndarray) -> np.ndarray:
+    """Weighted feature sum clipped to 0..100, evaluated as one fused expression when numexpr is available.
+
+    The numpy fallback accumulates into a single output buffer in place rather
+    than allocating a temporary per term.
+    """
+    if _numexpr is not None:
+        score = _numexpr.evaluate("20*he + 20*ho + lb + rs", local_dict={"he": he, "ho": ho, "lb": lb, "rs": rs})
+    else:
+        score = np.add(he, ho, dtype=np.result_type(rs, np.int16))
+        score *= 20
+        score += lb
+        score += rs
+    return np.clip(score, 0, 100, out=score)
+
+def _pct_rank(ts: np.ndarray) -> np.ndarray:
+    """Percent rank of int64 timestamps with ties averaged and NaT ranked 0.
 
-def score_contacts(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
+    Equivalent to Series.rank(pct=True).fillna(0) for datetimes, but works on the
+    raw int64 buffer with a single sort instead of pandas' generic ranker.
+    """
+    out = np.zeros(len(ts))
+    valid = ts != np.iinfo(np.int64).min  # NaT
+    n = int(valid.sum())
+    if n == 0:
+        return out
+    _, inverse, counts = np.unique(ts[valid], return_inverse=True, return_counts=True)
+    # average 1-based rank of each distinct timestamp
+    avg_rank = np.cumsum(counts) - (counts - 1) / 2.0
+    out[valid] = avg_rank[inverse.ravel()] / n
+    return out
 
+def score_contacts(df: pd.DataFrame, *, partial_lifecycle: bool = False) -> pd.DataFrame:
+    """Add a 0..100 `lead_score` column.
+
+    Lifecycle stages are matched exactly (case-insensitive) against the HubSpot
+    stage names; pass partial_lifecycle=True to match them as substrings.
+    The input frame is not modified; a new frame sharing its columns is returned.
+    """
     # Normalize commonly used columns
     email = _col(df, "email")
     owner = _col(df, "ownerId")
     lifecycle = _col(df, "lifecyclestage")
 
-    # Binary features
-    has_email = email.ne("").astype(int)
-    has_owner = owner.ne("").astype(int)
+    # Binary features. Work on plain arrays from here on so the arithmetic below
+    # runs without index alignment or intermediate Series. Missing values count
+    # as "not empty", exactly as the old str-cast ("nan") did; they are filled
+    # before the int8 conversion because pyarrow-backed booleans reject na_value=1.
+    has_email = email.ne("").fillna(True).to_numpy(dtype=np.int8)
+    has_owner = owner.ne("").fillna(True).to_numpy(dtype=np.int8)
 
     # Recency score (0..40) based on lastmodifieddate if present
     if "lastmodifieddate" in df.columns:
         recency = pd.to_datetime(df["lastmodifieddate"], errors="coerce")
-        recency_rank = recency.rank(pct=True).fillna(0)
-        recency_score = (recency_rank * 40).round(2)
+        if pd.api.types.is_datetime64_any_dtype(recency.dtype):
+            recency_rank = _pct_rank(recency.values.view("i8"))
+        else:
+            # mixed-offset strings can come back as object; use the generic ranker
+            recency_rank = recency.rank(pct=True).fillna(0).to_numpy()
+        recency_score = np.round(recency_rank * 40, 2)
+    else:
+        recency_score = np.zeros(len(df), dtype=int)
+
+    # Lifecycle boost (0 or 20). Hashed set membership on the lowercased values;
+    # the regex scan is only needed for substring matches.
+    if partial_lifecycle:
+        is_stage = lifecycle.str.contains(_LIFECYCLE_RE, na=False)
     else:
-        recency_score = pd.Series([0] * len(df))
+        is_stage = lifecycle.str.lower().isin(_LIFECYCLE_STAGES)
+    lifecycle_boost = is_stage.to_numpy(dtype=np.int8) * np.int8(20)
+
+    # Final score (0..100). The integer features are int8 (max 20+20+20); the
+    # recency term stays float64 because it flows straight into lead_score.
+    return df.assign(lead_score=_combine_score(has_email, has_owner, lifecycle_boost, recency_score))
+
+def _sorted_owner_rollup(df: pd.DataFrame) -> pd.DataFrame:
+    """owner_rollup aggregation for frames already sorted by ownerId.
+
+    Equal owners form contiguous runs, so count/mean reduce to np.add.reduceat
+    over the run starts — one linear pass, no hashing.
+    """
+    keys = df["ownerId"].to_numpy()
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    scores = df["lead_score"].to_numpy(dtype=float)
+    scored = ~np.isnan(scores)
+    counts = np.add.reduceat(df["id"].notna().to_numpy(dtype=np.int64), starts)
+    sums = np.add.reduceat(np.where(scored, scores, 0.0), starts)
+    n_scored = np.add.reduceat(scored.astype(np.int64), starts)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        avg = sums / n_scored
+    return pd.DataFrame({"ownerId": keys[starts], "count": counts, "avg_score": avg})
 
-    # Lifecycle boost (0 or 20)
-    # Use a regex without capturing groups to avoid pandas warning about match groups
-    lifecycle_boost = lifecycle.str.contains(
-        r"opportunity|customer|marketingqualifiedlead|salesqualifiedlead",
-        case=False, regex=True
-    ).astype(int) * 20
+def _by_score(out: pd.DataFrame) -> pd.DataFrame:
+    """Order a rollup by avg_score then count, both descending (NaN scores last).
 
-    # Final score (0..100)
-    df["lead_score"] = (20*has_email + 20*has_owner + lifecycle_boost + recency_score).clip(0, 100)
-    return df
+    Remaining ties go by ownerId ascending with a missing owner last, as the
+    key-sorted groupby followed by a stable sort_values used to give.
+    """
+    owners, uniques = pd.factorize(out["ownerId"], sort=True)
+    owners[owners < 0] = len(uniques)
+    order = np.lexsort((owners, -out["count"].to_numpy(), -out["avg_score"].to_numpy(dtype=float)))
+    return out.iloc[order].reset_index(drop=True)
 
 def owner_rollup(df: pd.DataFrame) -> pd.DataFrame:
     if "ownerId" not in df.columns:
         return pd.DataFrame({"ownerId": [], "count": [], "avg_score": []})
-    return (
-        df.groupby("ownerId", dropna=False)
+    if len(df) and df["ownerId"].is_monotonic_increasing:
+        return _by_score(_sorted_owner_rollup(df))
+    # Group only the columns the aggregation reads, and skip groupby's own key
+    # sort since the result is re-sorted by score below.
+    return _by_score(
+        df[["ownerId", "id", "lead_score"]]
+          .groupby("ownerId", dropna=False, sort=False)
           .agg(count=("id", "count"), avg_score=("lead_score", "mean"))
           .reset_index()
-          .sort_values(["avg_score", "count"], ascending=[False, False])
     )
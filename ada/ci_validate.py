@@ -1,36 +1,67 @@
 from __future__ import annotations
+import os
 import sys
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
 import json
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
+
+REQUIRED_FILES = ["contacts.csv", "lead_scores.csv", "summary.json", "summary.md"]
 
 def fail(msg: str):
     print("ERROR:", msg)
     sys.exit(2)
 
+def _loads(raw: bytes):
+    """Parse JSON bytes with orjson when installed, else the stdlib."""
+    return _orjson.loads(raw) if _orjson is not None else json.loads(raw)
+
+def _check_client(c: Path) -> List[str]:
+    """Return the problems found in one client directory (empty when valid)."""
+    problems: List[str] = []
+    # One directory listing instead of a stat() per required file
+    try:
+        with os.scandir(c) as it:
+            present = {e.name for e in it}
+    except OSError:
+        present = set()
+    for rf in REQUIRED_FILES:
+        if rf not in present:
+            problems.append(f"MISSING: {c / rf}")
+    if "summary.json" not in present:
+        return problems
+    # basic summary.json content check
+    sj = c / "summary.json"
+    try:
+        data = _loads(sj.read_bytes())
+        for k in ["contacts", "mean_quality", "ts_utc"]:
+            if k not in data:
+                problems.append(f"summary.json missing key {k} for {c}")
+    except Exception as e:
+        problems.append(f"summary.json invalid for {c}: {e}")
+    return problems
+
 def validate_audits(root: Path) -> None:
     if not root.exists():
         fail(f"audits root {root} does not exist")
-    clients = [p for p in root.iterdir() if p.is_dir()]
+    # scandir reports the entry type from the directory listing itself, so
+    # this needs no per-entry stat() on common filesystems.
+    with os.scandir(root) as it:
+        clients = sorted(Path(e.path) for e in it if e.is_dir())
     if not clients:
         fail(f"no client directories found under {root}")
-    required_files = ["contacts.csv", "lead_scores.csv", "summary.json", "summary.md"]
+    # Client checks are independent blocking I/O; run them concurrently and
+    # report in name order (map preserves input order).
+    with ThreadPoolExecutor(max_workers=min(32, len(clients))) as ex:
+        results = list(ex.map(_check_client, clients))
     ok = True
-    for c in clients:
-        for rf in required_files:
-            p = c / rf
-            if not p.exists():
-                print(f"MISSING: {p}")
-                ok = False
-        # basic summary.json content check
-        sj = c / "summary.json"
-        try:
-            data = json.loads(sj.read_text(encoding="utf-8"))
-            for k in ["contacts", "mean_quality", "ts_utc"]:
-                if k not in data:
-                    print(f"summary.json missing key {k} for {c}")
-                    ok = False
-        except Exception as e:
-            print(f"summary.json invalid for {c}: {e}")
+    for problems in results:
+        for line in problems:
+            print(line)
             ok = False
     if not ok:
         fail("audit validation failed")
@@ -1,7 +1,8 @@
 from __future__ import annotations
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Mapping
 from pydantic import BaseModel, Field
 from pathlib import Path
+from functools import lru_cache
 import re
 
 try:
@@ -30,14 +31,13 @@ class ClientConfig(BaseModel):
 _slug_non_alnum = re.compile(r"[^a-z0-9]+")
 
 
+@lru_cache(maxsize=1024)
 def slugify(name: str) -> str:
     """
     Convert a string into a safe slug: lowercase, underscores, no leading/trailing underscores.
     """
-    s = name.strip().lower()
-    s = _slug_non_alnum.sub("_", s)
-    s = re.sub(r"_+", "_", s).strip("_")
-    return s
+    # `[^a-z0-9]+` already folds runs (including existing underscores) into one "_"
+    return _slug_non_alnum.sub("_", name.strip().lower()).strip("_")
 
 
 def _load_toml(path: Path) -> Dict[str, Dict[str, Any]]:
@@ -58,15 +58,26 @@ def _load_yaml(path: Path) -> Dict[str, Dict[str, Any]]:
     return data
 
 
+# (resolved path, st_mtime_ns) -> parsed clients; an edited file gets a new key.
+_CLIENTS_CACHE: Dict[tuple[str, int], List[ClientConfig]] = {}
+
+
 def load_clients(path: str) -> List[ClientConfig]:
     """
     Load client configs from TOML or YAML. Top-level keys like:
       [client_acme_corp] → slug 'acme_corp' (strip 'client_' prefix).
     Required fields per section: name, hubspot_token. Optional: overrides.
+
+    Parsed results are cached per file modification time, so repeated calls
+    with an unchanged file skip the TOML/YAML parse.
     """
     p = Path(path)
     if not p.exists():
         raise FileNotFoundError(f"Client config not found: {p}")
+    cache_key = (str(p.resolve()), p.stat().st_mtime_ns)
+    hit = _CLIENTS_CACHE.get(cache_key)
+    if hit is not None:
+        return list(hit)
 
     if p.suffix.lower() in (".toml",):
         raw = _load_toml(p)
@@ -89,12 +100,27 @@ def load_clients(path: str) -> List[ClientConfig]:
         clients.append(ClientConfig(slug=slug, name=name, hubspot_token=token, overrides=overrides))
     if not clients:
         raise ValueError("No clients loaded from config.")
-    return clients
+    _CLIENTS_CACHE[cache_key] = clients
+    return list(clients)
+
 
+def index_clients(clients: List[ClientConfig]) -> Dict[str, ClientConfig]:
+    """Map slug → ClientConfig for repeated get_client lookups."""
+    return {c.slug: c for c in clients}
 
-def get_client(clients: List[ClientConfig], slug: str) -> ClientConfig:
-    """Find a client by slug (case-insensitive)."""
+
+def get_client(clients: List[ClientConfig] | Mapping[str, ClientConfig], slug: str) -> ClientConfig:
+    """Find a client by slug (case-insensitive).
+
+    Accepts the list from load_clients or, for O(1) lookups in loops, the
+    mapping from index_clients.
+    """
     target = slugify(slug)
+    if isinstance(clients, Mapping):
+        found = clients.get(target)
+        if found is None:
+            raise KeyError(f"Client '{slug}' not found. Available: {list(clients)}")
+        return found
     for c in clients:
         if c.slug == target:
             return c
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Iterable, Protocol
+from typing import Iterable, List, Protocol
 from ada.core.schemas import Contact, Message
 from datetime import datetime
 
@@ -28,5 +28,8 @@ class MailConnector(Protocol):
     def send(self, message: Message) -> Message:
         """Send a prepared message and return updated Message (status, meta)."""
 
+    def send_batch(self, messages: List[Message]) -> List[Message]:
+        """Send several prepared messages, sharing per-batch work (e.g. timestamps)."""
+
     def list_replies(self, since: datetime) -> Iterable[Message]:
         """List incoming messages/replies since a cutoff."""
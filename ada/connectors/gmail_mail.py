@@ -1,12 +1,58 @@
 from __future__ import annotations
-from typing import Iterable, Optional
+from typing import Iterable, List, Optional
 from email.message import EmailMessage
+import email.policy
 from datetime import datetime
 from ada.core import schemas
 from .base import TerminalError
+import itertools
+import re
 import time
 
 
+# Draft ids are saved with an upsert on id; the counter keeps drafts minted in
+# the same clock tick from overwriting each other.
+_MSG_SEQ = itertools.count()
+
+# EmailMessage emits these after the caller's headers for 7bit plain text
+_PLAIN_MIME_TAIL = "Content-Type: text/plain; charset=\"utf-8\"\nContent-Transfer-Encoding: 7bit\nMIME-Version: 1.0\n\n"
+_MAX_LINE = email.policy.default.max_line_length  # 78
+# Printable ASCII; EmailMessage folds, encodes or splits on anything else
+_HEADER_RE = re.compile(r"[ -~]*")
+# Bare addresses that the address-header parser re-emits verbatim
+_ADDR_RE = re.compile(r"[A-Za-z0-9_%+-]+(?:\.[A-Za-z0-9_%+-]+)*@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*")
+_BODY_RE = re.compile(r"[ -~\t\n]*")
+
+
+def _fast_mime(subject: str, body: str, frm: str, to: str) -> Optional[str]:
+    """Serialize a plain-text message by string assembly.
+
+    Produces exactly what EmailMessage.as_string() would, and returns None
+    whenever that output would differ from plain concatenation: anything but a
+    bare address in From/To, non-ASCII or control characters (encoding, header
+    injection), encoded words, or any header or body line longer than
+    policy.max_line_length (folding, quoted-printable).
+    """
+    if not (_ADDR_RE.fullmatch(frm or "") and _ADDR_RE.fullmatch(to or "")):
+        return None
+    headers = [("From", frm), ("To", to)]
+    if subject:
+        headers.append(("Subject", subject))
+    head = ""
+    for name, value in headers:
+        line = f"{name}: {value}\n"
+        # "=?" may start an RFC 2047 encoded word, which EmailMessage decodes
+        if len(line) > _MAX_LINE + 1 or "=?" in value or not _HEADER_RE.fullmatch(value):
+            return None
+        head += line
+    body = body or ""
+    if not _BODY_RE.fullmatch(body) or any(len(line) > _MAX_LINE for line in body.split("\n")):
+        return None
+    if not body.endswith("\n"):
+        body += "\n"
+    return head + _PLAIN_MIME_TAIL + body
+
+
 class GmailConnector:
     """Minimal Gmail REST-like connector.
 
@@ -35,9 +81,11 @@ class GmailConnector:
         return m
 
     def draft(self, subject: str, body: str, to: str) -> schemas.Message:
-        msg = self._build_message(subject, body, to)
-        mid = f"msg_{int(time.time() * 1000)}"
-        return schemas.Message(
+        mime = _fast_mime(subject, body, self.user, to)
+        if mime is None:
+            mime = self._build_message(subject, body, to).as_string()
+        mid = f"msg_{time.time_ns()}_{next(_MSG_SEQ)}"
+        return schemas.Message.from_trusted(
             id=mid,
             client_slug=self.client_cfg.get("slug", ""),
             contact_id=to,
@@ -47,19 +95,25 @@ class GmailConnector:
             body=body,
             ts=datetime.utcnow(),
             status="draft",
-            meta={"mime": msg.as_string()},
+            meta={"mime": mime},
         )
 
     def send(self, message: schemas.Message) -> schemas.Message:
-        # In a minimal mode just mark as sent and attach a send_ts
-        if message.status not in ("approved", "queued", "draft"):
-            message.status = "failed"
-            message.meta["error"] = "invalid-status-for-send"
-            return message
-        # Simulate API latency/backoff boundary
-        message.status = "sent"
-        message.meta["sent_at"] = datetime.utcnow().isoformat()
-        return message
+        return self.send_batch([message])[0]
+
+    def send_batch(self, messages: List[schemas.Message]) -> List[schemas.Message]:
+        """Send several messages; the whole batch shares one sent_at stamp."""
+        sent_at = datetime.utcnow().isoformat()
+        for message in messages:
+            # In a minimal mode just mark as sent and attach a send_ts
+            if message.status not in ("approved", "queued", "draft"):
+                message.status = "failed"
+                message.meta["error"] = "invalid-status-for-send"
+                continue
+            # Simulate API latency/backoff boundary
+            message.status = "sent"
+            message.meta["sent_at"] = sent_at
+        return messages
 
     def list_replies(self, since: datetime) -> Iterable[schemas.Message]:
         # Minimal stub: no live API calls. Real implementation would call Gmail users.messages.list and get, then yield Message items.
@@ -1,34 +1,45 @@
 from __future__ import annotations
-from typing import Iterable
-from tenacity import retry, wait_exponential, stop_after_attempt, retry_if_exception_type
+from typing import Iterable, Optional
 from ada.core.schemas import Contact
 from ada import hubspot
 from datetime import datetime
 
+_PROPS = ["email", "firstname", "lastname", "lifecyclestage", "hubspot_owner_id", "lastmodifieddate"]
 
-@retry(wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(4), retry=retry_if_exception_type(Exception))
-def _safe_stream(*args, **kwargs):
-    return list(hubspot.stream_contacts(*args, **kwargs))
+
+def _parse_lastmodified(lm) -> Optional[datetime]:
+    """Parse HubSpot's lastmodifieddate (epoch millis or ISO-8601) or return None."""
+    if not lm:
+        return None
+    if isinstance(lm, str) and not lm.isdigit():
+        try:
+            return datetime.fromisoformat(lm.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    try:
+        return datetime.fromtimestamp(int(lm) / 1000)
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
 
 
 def get_contacts(limit: int = 1000) -> Iterable[Contact]:
-    """Yield Contact models converted from hubspot.stream_contacts payloads."""
-    props = ["email", "firstname", "lastname", "lifecyclestage", "hubspot_owner_id", "lastmodifieddate"]
-    for raw in _safe_stream(max_total=limit, properties=props):
-        p = raw.get("properties", {}) or {}
-        try:
-            lm = p.get("lastmodifieddate")
-            lm_ts = datetime.fromtimestamp(int(lm) / 1000, tz=None) if lm else None
-        except Exception:
-            lm_ts = None
-        yield Contact(
+    """Yield Contact models converted from hubspot.stream_contacts payloads.
+
+    Contacts are yielded as pages arrive. Transient HTTP failures are retried
+    per page inside hubspot.list_contacts, so a retry re-requests one page
+    instead of restarting and re-buffering the whole pull.
+    """
+    build = Contact.from_trusted
+    for raw in hubspot.stream_contacts(max_total=limit, properties=_PROPS):
+        get = (raw.get("properties") or {}).get
+        yield build(
             id=str(raw.get("id")),
-            email=p.get("email"),
-            first_name=p.get("firstname"),
-            last_name=p.get("lastname"),
-            owner_id=p.get("hubspot_owner_id"),
-            lifecycle=p.get("lifecyclestage"),
-            last_modified=lm_ts,
+            email=get("email"),
+            first_name=get("firstname"),
+            last_name=get("lastname"),
+            owner_id=get("hubspot_owner_id"),
+            lifecycle=get("lifecyclestage"),
+            last_modified=_parse_lastmodified(get("lastmodifieddate")),
             score=None,
             source="hubspot",
         )
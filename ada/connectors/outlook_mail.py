@@ -13,21 +13,27 @@ Expected client config keys (can be provided via ClientConfig.overrides):
 
 Behavior:
 - draft(): constructs a Message with channel="outlook" and status="draft".
-- send(): transitions approved/draft/queued messages to status="sent" and
-  annotates meta with sent_at; simulates light backoff boundaries.
+- send()/send_batch(): transition approved/draft/queued messages to
+  status="sent" and annotate meta with sent_at (one stamp per batch).
 - list_replies(since): returns an empty iterable; real implementation would
   call MS Graph /messages with filters.
 
 Rate limiting and quiet hours policy are handled in higher layers (policy/CLI).
 """
-from typing import Iterable
+from typing import Iterable, List
 from datetime import datetime
+import itertools
 import time
 from email.message import EmailMessage
 from ada.core import schemas
 from .base import TerminalError
 
 
+# Draft ids are saved with an upsert on id; the counter keeps drafts minted in
+# the same clock tick from overwriting each other.
+_MSG_SEQ = itertools.count()
+
+
 class OutlookConnector:
     """Minimal Outlook connector for Phase 2 tests.
 
@@ -58,9 +64,8 @@ class OutlookConnector:
         return m
 
     def draft(self, subject: str, body: str, to: str) -> schemas.Message:
-        mid = f"omsg_{int(time.time() * 1000)}"
-        _ = self._build_message(subject, body, to)
-        return schemas.Message(
+        mid = f"omsg_{time.time_ns()}_{next(_MSG_SEQ)}"
+        return schemas.Message.from_trusted(
             id=mid,
             client_slug=self.client_cfg.get("slug", ""),
             contact_id=to,
@@ -74,14 +79,20 @@ class OutlookConnector:
         )
 
     def send(self, message: schemas.Message) -> schemas.Message:
-        if message.status not in ("approved", "queued", "draft"):
-            message.status = "failed"
-            message.meta["error"] = "invalid-status-for-send"
-            return message
-        # Simulate success
-        message.status = "sent"
-        message.meta["sent_at"] = datetime.utcnow().isoformat()
-        return message
+        return self.send_batch([message])[0]
+
+    def send_batch(self, messages: List[schemas.Message]) -> List[schemas.Message]:
+        """Send several messages; the whole batch shares one sent_at stamp."""
+        sent_at = datetime.utcnow().isoformat()
+        for message in messages:
+            if message.status not in ("approved", "queued", "draft"):
+                message.status = "failed"
+                message.meta["error"] = "invalid-status-for-send"
+                continue
+            # Simulate success
+            message.status = "sent"
+            message.meta["sent_at"] = sent_at
+        return messages
 
     def list_replies(self, since: datetime) -> Iterable[schemas.Message]:
         # Stub: no live API calls in CI
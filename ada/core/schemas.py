@@ -4,6 +4,12 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 
 
+def _construct(cls, data: Dict[str, Any]):
+    """Skip validation: pydantic v2 `model_construct`, v1 `construct`."""
+    build = getattr(cls, "model_construct", None) or cls.construct
+    return build(**data)
+
+
 class Contact(BaseModel):
     id: str
     email: Optional[str]
@@ -22,6 +28,11 @@ class Contact(BaseModel):
     def from_dict(cls, data: Dict[str, Any]) -> "Contact":
         return cls(**data)
 
+    @classmethod
+    def from_trusted(cls, **data: Any) -> "Contact":
+        """Build without validation for already-typed values (connector hot paths)."""
+        return _construct(cls, data)
+
 
 class Message(BaseModel):
     id: str
@@ -35,6 +46,11 @@ class Message(BaseModel):
     status: Literal["draft", "approved", "queued", "sent", "failed"] = "draft"
     meta: Dict[str, Any] = Field(default_factory=dict)
 
+    @classmethod
+    def from_trusted(cls, **data: Any) -> "Message":
+        """Build without validation for already-typed values (connector hot paths)."""
+        return _construct(cls, data)
+
 
 class Thread(BaseModel):
     id: str
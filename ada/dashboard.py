@@ -1,36 +1,70 @@
 from __future__ import annotations
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+from functools import lru_cache
+import csv
+from html import escape
 import json
+import os
+try:
+  import orjson as _orjson
+except Exception:
+  _orjson = None
 from .clients import ClientConfig
 
+@lru_cache(maxsize=1024)
+def _load_json_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+  # mtime/size are part of the cache key only: a rewritten file misses the cache
+  raw = Path(path_str).read_bytes()
+  return _orjson.loads(raw) if _orjson is not None else json.loads(raw)
+
+def _read_json(p: Path) -> Optional[Any]:
+  """Parsed JSON at `p` (shared, treat as read-only), or None if the file is absent."""
+  try:
+    st = p.stat()
+  except FileNotFoundError:
+    return None
+  return _load_json_cached(str(p), st.st_mtime_ns, st.st_size)
+
+# Cell values pandas' read_csv would have treated as missing
+_CSV_NA = frozenset({"", "nan", "NaN", "NA", "N/A", "null", "NULL", "None"})
+
 def collect_metrics(client_dir: Path) -> Dict[str, Any]:
   """
   Read summary.json; fallback to CSV if missing.
   Returns keys: mean_quality, dormant_pct, owner_imbalance_pct, last_audited, summary_href.
   """
   summary_json = client_dir / "summary.json"
-  summary_md = client_dir / "summary.md"
-  summary_html = client_dir / "summary.html"
   lead_csv = client_dir / "lead_scores.csv"
+  # One directory listing answers every "does X exist" question below
+  try:
+    with os.scandir(client_dir) as it:
+      names = {e.name for e in it}
+  except OSError:
+    names = set()
   insights: Dict[str, Any] = {
     "mean_quality": 0.0,
     "dormant_pct": 0.0,
     "owner_imbalance_pct": 0.0,
     "last_audited": "",
-    "summary_href": "summary.html" if summary_html.exists() else ("summary.md" if summary_md.exists() else ""),
+    "summary_href": "summary.html" if "summary.html" in names else ("summary.md" if "summary.md" in names else ""),
     "contacted": 0,
     "replies": 0,
     "meetings": 0,
     "reply_rate": 0.0,
-    "outbox_link": "outbox.sqlite" if (client_dir / "outbox.sqlite").exists() else "",
+    "outbox_link": "outbox.sqlite" if "outbox.sqlite" in names else "",
     # new per-channel splits for UI
     "contacted_by_channel": {},
     "replies_by_channel": {},
   }
-  if summary_json.exists():
+  data = None
+  if "summary.json" in names:
+    try:
+      data = _read_json(summary_json)
+    except Exception:
+      data = None
+  if data is not None:
     try:
-      data = json.loads(summary_json.read_text(encoding="utf-8"))
       insights["mean_quality"] = float(data.get("mean_quality", 0.0))
       insights["dormant_pct"] = float(data.get("dormant_pct", 0.0))
       insights["owner_imbalance_pct"] = float(data.get("owner_imbalance_pct", 0.0))
@@ -46,24 +80,91 @@ def collect_metrics(client_dir: Path) -> Dict[str, Any]:
       return insights
     except Exception:
       pass
-  if lead_csv.exists():
+  if "lead_scores.csv" in names:
     try:
-      import pandas as pd  # type: ignore
-      df = pd.read_csv(lead_csv)
-      if "lead_score" in df.columns:
-        insights["mean_quality"] = float(round(df["lead_score"].mean(), 2))
+      # Running mean over the one column we need; no pandas import or full-frame parse
+      total, n = 0.0, 0
+      with lead_csv.open(newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        if "lead_score" in header:
+          i = header.index("lead_score")
+          for row in reader:
+            v = row[i] if i < len(row) else ""
+            if v in _CSV_NA:
+              continue
+            total += float(v)
+            n += 1
+      if n:
+        insights["mean_quality"] = round(total / n, 2)
     except Exception:
-      # Non-fatal if pandas isn't available in this runtime
+      # Non-fatal: malformed CSV leaves the default
       pass
   return insights
 
+# Static page chunks, assembled once at import; only per-client values are
+# formatted (and HTML-escaped) at render time.
+_PAGE_HEAD = """<!doctype html>
+<html>
+<head>
+  <meta charset="utf-8">
+  <title>ADA Consultant Dashboard</title>
+  <meta name="viewport" content="width=device-width, initial-scale=1">
+  <style>
+  body{font-family:system-ui, -apple-system, Segoe UI, Roboto, sans-serif; margin:40px;}
+  table{border-collapse:collapse; width:100%; max-width:1100px;}
+  th,td{border:1px solid #ddd; padding:8px; text-align:left;}
+  th{background:#f6f8fa;}
+  tr:nth-child(even){background:#fafafa;}
+  .muted{color:#666; font-size:12px}
+  </style>
+  </head>
+  <body>
+  <h1>ADA Consultant Dashboard</h1>
+  <p class="muted">Per-client audit summaries generated by ADA.</p>
+  <table>
+    <thead>
+      <tr>
+        <th>Client</th>
+        <th>Last Audited (UTC)</th>
+        <th>Avg Quality</th>
+        <th>% Dormant</th>
+        <th>Owner Load</th>
+        <th>Contacted</th>
+        <th>Replies</th>
+        <th>Reply Rate</th>
+        <th>Report</th>
+      </tr>
+    </thead>
+    <tbody>
+  """
+_PAGE_MID = """
+    </tbody>
+  </table>
+  """
+_PAGE_TAIL = """
+  </body>
+  </html>
+"""
+_NO_AUDITS_ROW = '<tr><td colspan="9">No audits yet.</td></tr>'
+_VARIANT_TABLE_HEAD = "<table><thead><tr><th>Variant ID</th><th>Sent</th><th>Opens</th><th>Replies</th><th>Meetings</th><th>Reply Rate</th><th>Conversion</th></tr></thead><tbody>"
+
+def _fmt_split(d: Dict[str, Any]) -> str:
+    try:
+        return escape(", ".join(f"{k}:{int(v)}" for k, v in d.items())) if d else "—"
+    except Exception:
+        return "—"
+
 def render_master_index(clients: List[ClientConfig], audits_root: Path, out_path: Path) -> None:
     rows: List[str] = []
+    collected: List[tuple] = []
     for c in clients:
         cdir = audits_root / c.slug
         m = collect_metrics(cdir)
+        collected.append((c, m))
         link = m.get("summary_href") or ""
-        link_html = f'<a href="{c.slug}/{link}">Open</a>' if link else "—"
+        name, slug = escape(c.name), escape(c.slug)
+        link_html = f'<a href="{slug}/{escape(link)}">Open</a>' if link else "—"
         failed = (cdir / "error.txt").exists()
         conn_err = (cdir / "connector_error.txt").exists()
         status_txt = "FAILED" if failed or conn_err else ""
@@ -71,40 +172,30 @@ def render_master_index(clients: List[ClientConfig], audits_root: Path, out_path
         if conn_err:
             try:
                 tip = (cdir / "connector_error.txt").read_text(encoding="utf-8").strip().splitlines()[0]
-                title_attr = f' title="{tip}"'
+                title_attr = f' title="{escape(tip)}"'
             except Exception:
                 title_attr = ''
         status_html = f'<span style="color:red;font-weight:600"{title_attr}>{status_txt}</span>' if status_txt else ""
 
-        def fmt_split(d: Dict[str, Any]) -> str:
-            try:
-                return ", ".join(f"{k}:{int(v)}" for k, v in d.items()) if d else "—"
-            except Exception:
-                return "—"
-
         rows.append(
             "<tr>"
-            f"<td>{c.name} <small>({c.slug})</small> {status_html}</td>"
-            f"<td>{m.get('last_audited','')}</td>"
+            f"<td>{name} <small>({slug})</small> {status_html}</td>"
+            f"<td>{escape(str(m.get('last_audited','')))}</td>"
             f"<td>{m.get('mean_quality',0.0):.2f}</td>"
             f"<td>{m.get('dormant_pct',0.0):.2f}%</td>"
             f"<td>{m.get('owner_imbalance_pct',0.0):.2f}%</td>"
-            f"<td>{fmt_split(m.get('contacted_by_channel',{}))}</td>"
-            f"<td>{fmt_split(m.get('replies_by_channel',{}))}</td>"
+            f"<td>{_fmt_split(m.get('contacted_by_channel',{}))}</td>"
+            f"<td>{_fmt_split(m.get('replies_by_channel',{}))}</td>"
             f"<td>{m.get('reply_rate',0.0):.2f}</td>"
             f"<td>{link_html}</td>"
             "</tr>"
         )
 
-    # Variant sections per client
+    # Variant sections per client, from the summaries collect_metrics already parsed
     variant_sections: List[str] = []
-    for c in clients:
-        sfile = audits_root / c.slug / "summary.json"
-        if not sfile.exists():
-            continue
+    for c, m in collected:
         try:
-            data = json.loads(sfile.read_text(encoding="utf-8"))
-            vperf = data.get("variant_perf") or []
+            vperf = m.get("variant_perf") or []
             if not vperf:
                 continue
             rows_v = []
@@ -114,7 +205,7 @@ def render_master_index(clients: List[ClientConfig], audits_root: Path, out_path
                 rr = (replies / sent) if sent else 0.0
                 rows_v.append(
                     "<tr>"
-                    f"<td>{v.get('variant_id','')}</td>"
+                    f"<td>{escape(str(v.get('variant_id','')))}</td>"
                     f"<td>{sent}</td>"
                     f"<td>{int(v.get('opens',0) or 0)}</td>"
                     f"<td>{replies}</td>"
@@ -124,53 +215,14 @@ def render_master_index(clients: List[ClientConfig], audits_root: Path, out_path
                     "</tr>"
                 )
             variant_sections.append(
-                f"<h3>Variants & Tests — {c.name} ({c.slug})</h3>\n"
-                "<table><thead><tr><th>Variant ID</th><th>Sent</th><th>Opens</th><th>Replies</th><th>Meetings</th><th>Reply Rate</th><th>Conversion</th></tr></thead><tbody>"
+                f"<h3>Variants & Tests — {escape(c.name)} ({escape(c.slug)})</h3>\n"
+                + _VARIANT_TABLE_HEAD
                 + "".join(rows_v)
                 + "</tbody></table>"
             )
         except Exception:
             continue
 
-    html = f"""<!doctype html>
-<html>
-<head>
-  <meta charset=\"utf-8\">
-  <title>ADA Consultant Dashboard</title>
-  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">
-  <style>
-  body{{font-family:system-ui, -apple-system, Segoe UI, Roboto, sans-serif; margin:40px;}}
-  table{{border-collapse:collapse; width:100%; max-width:1100px;}}
-  th,td{{border:1px solid #ddd; padding:8px; text-align:left;}}
-  th{{background:#f6f8fa;}}
-  tr:nth-child(even){{background:#fafafa;}}
-  .muted{{color:#666; font-size:12px}}
-  </style>
-  </head>
-  <body>
-  <h1>ADA Consultant Dashboard</h1>
-  <p class=\"muted\">Per-client audit summaries generated by ADA.</p>
-  <table>
-    <thead>
-      <tr>
-        <th>Client</th>
-        <th>Last Audited (UTC)</th>
-        <th>Avg Quality</th>
-        <th>% Dormant</th>
-        <th>Owner Load</th>
-        <th>Contacted</th>
-        <th>Replies</th>
-        <th>Reply Rate</th>
-        <th>Report</th>
-      </tr>
-    </thead>
-    <tbody>
-  {''.join(rows) if rows else '<tr><td colspan="9">No audits yet.</td></tr>'}
-    </tbody>
-  </table>
-  {''.join(variant_sections)}
-  </body>
-  </html>
-"""
+    html = "".join((_PAGE_HEAD, "".join(rows) if rows else _NO_AUDITS_ROW, _PAGE_MID, "".join(variant_sections), _PAGE_TAIL))
     out_path.parent.mkdir(parents=True, exist_ok=True)
     out_path.write_text(html, encoding="utf-8")
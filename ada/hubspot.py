@@ -1,33 +1,83 @@
 from __future__ import annotations
+import atexit
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 import httpx
-from tenacity import retry, wait_exponential, stop_after_attempt
+from tenacity import retry, retry_if_exception, wait_exponential, stop_after_attempt
+try:
+    import h2  # noqa: F401  (enables httpx's HTTP/2 support)
+    _HTTP2 = True
+except Exception:
+    _HTTP2 = False
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
 
 API = "https://api.hubapi.com"
 
-def _token() -> str:
-    t = os.getenv("HUBSPOT_TOKEN")
+def _token(token: Optional[str] = None) -> str:
+    t = token or os.getenv("HUBSPOT_TOKEN")
     if not t:
         raise RuntimeError("HUBSPOT_TOKEN is not set")
     return t
 
-def _client() -> httpx.Client:
-    return httpx.Client(
-        base_url=API,
-        headers={"Authorization": f"Bearer {_token()}", "Content-Type": "application/json"},
-        timeout=30.0,
-    )
-
-@retry(wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(5))
-def list_owners() -> List[Dict]:
-    with _client() as c:
-        r = c.get("/crm/v3/owners")
-        r.raise_for_status()
-        return r.json().get("results", [])
+# One long-lived client per token so paginated calls reuse the TCP/TLS
+# connection instead of handshaking per page. Keyed by token because audits
+# pass a different token per client (possibly from several threads).
+_CLIENTS: Dict[str, httpx.Client] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+def _client(token: Optional[str] = None) -> httpx.Client:
+    """Cached client for `token`, or for HUBSPOT_TOKEN when no token is given."""
+    token = _token(token)
+    with _CLIENTS_LOCK:
+        c = _CLIENTS.get(token)
+        if c is None:
+            c = _CLIENTS[token] = httpx.Client(
+                base_url=API,
+                headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
+                timeout=30.0,
+                http2=_HTTP2,
+            )
+    return c
+
+def close_clients() -> None:
+    with _CLIENTS_LOCK:
+        clients = list(_CLIENTS.values())
+        _CLIENTS.clear()
+    for c in clients:
+        c.close()
+
+atexit.register(close_clients)
+
+def _json(r: httpx.Response):
+    """Decode a response body, straight from bytes via orjson when installed."""
+    return _orjson.loads(r.content) if _orjson is not None else r.json()
+
+def _is_transient(exc: BaseException) -> bool:
+    """Worth retrying: transport failures, 429 and 5xx. Other 4xx fail at once."""
+    if isinstance(exc, RuntimeError) and isinstance(exc.__cause__, httpx.HTTPStatusError):
+        exc = exc.__cause__  # list_contacts wraps the listing error after its fallbacks
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, httpx.TransportError)
 
-@retry(wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(5))
-def list_contacts(limit:int=200, after:Optional[str]=None, properties:Optional[List[str]]=None) -> Dict:
+# Shared retry policy; retries go back through _client(), so they reuse the
+# cached connection rather than opening a new one per attempt.
+_retry = retry(retry=retry_if_exception(_is_transient), wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(5))
+
+@_retry
+def list_owners(token: Optional[str] = None) -> List[Dict]:
+    r = _client(token).get("/crm/v3/owners")
+    r.raise_for_status()
+    return _json(r).get("results", [])
+
+@_retry
+def list_contacts(limit:int=200, after:Optional[str]=None, properties:Optional[List[str]]=None, token:Optional[str]=None) -> Dict:
     # Build a conservative request that only includes limit/after. Some
     # HubSpot accounts reject property filters in this endpoint and return
     # 400 Invalid request; to maximize compatibility in CI we omit the
@@ -36,87 +86,103 @@ def list_contacts(limit:int=200, after:Optional[str]=None, properties:Optional[L
     params = {"limit": min(limit, 100)}
     if after:
         params["after"] = after
-    with _client() as c:
-        r = c.get("/crm/v3/objects/contacts", params=params)
-        try:
-            r.raise_for_status()
-            return r.json()
-        except httpx.HTTPStatusError as e:
-            # If the listing endpoint fails (some HubSpot accounts reject
-            # it), try the search endpoint as a fallback which is often
-            # more tolerant of filtering and account differences.
-            # We'll attempt two fallback payloads and capture rich
-            # diagnostics if all attempts fail so CI artifacts contain
-            # the raw responses for easier triage.
-            diagnostics = []
-            def _resp_info(resp):
-                try:
-                    text = resp.text
-                except Exception:
-                    text = "(unable to read body)"
-                return {
-                    "status_code": getattr(resp, "status_code", None),
-                    "headers": dict(getattr(resp, "headers", {})),
-                    "body": text,
-                }
-
-            # First fallback: search with empty filterGroups (works in many accounts)
+    c = _client(token)
+    r = c.get("/crm/v3/objects/contacts", params=params)
+    try:
+        r.raise_for_status()
+        return _json(r)
+    except httpx.HTTPStatusError as e:
+        # If the listing endpoint fails (some HubSpot accounts reject
+        # it), try the search endpoint as a fallback which is often
+        # more tolerant of filtering and account differences.
+        # We'll attempt two fallback payloads and capture rich
+        # diagnostics if all attempts fail so CI artifacts contain
+        # the raw responses for easier triage.
+        diagnostics = []
+        def _resp_info(resp):
             try:
-                alt_body = {"filterGroups": [], "limit": min(limit, 100)}
-                r2 = c.post("/crm/v3/objects/contacts/search", json=alt_body)
-                try:
-                    r2.raise_for_status()
-                    return r2.json()
-                except Exception:
-                    diagnostics.append(("search(empty filterGroups)", _resp_info(r2)))
-            except Exception as err:
-                diagnostics.append(("search(empty filterGroups)_request_error", str(err)))
-
-            # Second fallback: some portals accept a query-style body
+                text = resp.text
+            except Exception:
+                text = "(unable to read body)"
+            return {
+                "status_code": getattr(resp, "status_code", None),
+                "headers": dict(getattr(resp, "headers", {})),
+                "body": text,
+            }
+
+        # First fallback: search with empty filterGroups (works in many accounts)
+        try:
+            alt_body = {"filterGroups": [], "limit": min(limit, 100)}
+            r2 = c.post("/crm/v3/objects/contacts/search", json=alt_body)
             try:
-                alt_body2 = {"query": "", "limit": min(limit, 100)}
-                r3 = c.post("/crm/v3/objects/contacts/search", json=alt_body2)
-                try:
-                    r3.raise_for_status()
-                    return r3.json()
-                except Exception:
-                    diagnostics.append(("search(query=\"\")", _resp_info(r3)))
-            except Exception as err:
-                diagnostics.append(("search(query)_request_error", str(err)))
-
-            # Nothing worked — include full diagnostics from the original
-            # listing response plus any fallback responses we saw.
-            # Third fallback: try the legacy contacts endpoint which some
-            # portals still support. We'll normalize its response into the
-            # same shape (results list) so callers don't need to change.
+                r2.raise_for_status()
+                return _json(r2)
+            except Exception:
+                diagnostics.append(("search(empty filterGroups)", _resp_info(r2)))
+        except Exception as err:
+            diagnostics.append(("search(empty filterGroups)_request_error", str(err)))
+
+        # Second fallback: some portals accept a query-style body
+        try:
+            alt_body2 = {"query": "", "limit": min(limit, 100)}
+            r3 = c.post("/crm/v3/objects/contacts/search", json=alt_body2)
             try:
-                legacy_params = {"count": min(limit, 100)}
-                r4 = c.get("/contacts/v1/lists/all/contacts/all", params=legacy_params)
-                try:
-                    r4.raise_for_status()
-                    j = r4.json()
-                    # Normalize: legacy returns 'contacts' array
-                    results = j.get("contacts", [])
-                    return {"results": results}
-                except Exception:
-                    diagnostics.append(("legacy(contacts_v1)", _resp_info(r4)))
-            except Exception as err:
-                diagnostics.append(("legacy_request_error", str(err)))
+                r3.raise_for_status()
+                return _json(r3)
+            except Exception:
+                diagnostics.append(("search(query=\"\")", _resp_info(r3)))
+        except Exception as err:
+            diagnostics.append(("search(query)_request_error", str(err)))
 
+        # Nothing worked — include full diagnostics from the original
+        # listing response plus any fallback responses we saw.
+        # Third fallback: try the legacy contacts endpoint which some
+        # portals still support. We'll normalize its response into the
+        # same shape (results list) so callers don't need to change.
+        try:
+            legacy_params = {"count": min(limit, 100)}
+            r4 = c.get("/contacts/v1/lists/all/contacts/all", params=legacy_params)
             try:
-                orig_body = r.text
+                r4.raise_for_status()
+                j = _json(r4)
+                # Normalize: legacy returns 'contacts' array
+                results = j.get("contacts", [])
+                return {"results": results}
             except Exception:
-                orig_body = "(unable to read response body)"
-            info = {"original": {"status_code": getattr(r, "status_code", None), "body": orig_body}, "fallbacks": diagnostics}
-            raise RuntimeError(f"HubSpot API listing failed: {info}") from e
-
-def stream_contacts(max_total:int=2000, properties:Optional[List[str]]=None):
-    total, after = 0, None
-    while total < max_total:
-        page = list_contacts(limit=100, after=after, properties=properties)
-        for row in page.get("results", []):
-            yield row
-            total += 1
-            if total >= max_total: return
-        after = page.get("paging", {}).get("next", {}).get("after")
-        if not after: break
+                diagnostics.append(("legacy(contacts_v1)", _resp_info(r4)))
+        except Exception as err:
+            diagnostics.append(("legacy_request_error", str(err)))
+
+        try:
+            orig_body = r.text
+        except Exception:
+            orig_body = "(unable to read response body)"
+        info = {"original": {"status_code": getattr(r, "status_code", None), "body": orig_body}, "fallbacks": diagnostics}
+        raise RuntimeError(f"HubSpot API listing failed: {info}") from e
+
+def stream_contacts(max_total:int=2000, properties:Optional[List[str]]=None, token:Optional[str]=None):
+    # Page N+1's cursor is known as soon as page N arrives, so fetch it on a
+    # worker thread while the caller is still consuming page N's rows.
+    # Pages are full (100, the endpoint's cap) except the last, which only
+    # asks for the rows still needed to reach max_total.
+    if max_total <= 0:
+        return
+    total = 0
+    pool = ThreadPoolExecutor(max_workers=1)
+    try:
+        nxt = pool.submit(list_contacts, limit=min(100, max_total), after=None, properties=properties, token=token)
+        while nxt is not None:
+            page = nxt.result()
+            results = page.get("results", [])
+            after = page.get("paging", {}).get("next", {}).get("after")
+            nxt = None
+            remaining = max_total - total - len(results)
+            if after and remaining > 0:
+                nxt = pool.submit(list_contacts, limit=min(100, remaining), after=after, properties=properties, token=token)
+            for row in results:
+                yield row
+                total += 1
+                if total >= max_total: return
+    finally:
+        # don't block an early-exiting caller on a prefetch it no longer needs
+        pool.shutdown(wait=False, cancel_futures=True)
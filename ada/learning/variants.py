@@ -1,11 +1,13 @@
 from __future__ import annotations
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Tuple
+from collections import Counter
 from pydantic import BaseModel, Field
 from pathlib import Path
+import atexit
 import random
 import sqlite3
+import threading
 import json
-from datetime import datetime
 
 
 class Variant(BaseModel):
@@ -18,102 +20,190 @@ class Variant(BaseModel):
 
 DB_FILENAME = "learning.sqlite"
 
+# SQLite-side UTC timestamp, so updates don't build a Python datetime.
+_SQL_NOW = "strftime('%Y-%m-%dT%H:%M:%f','now')"
+
 
 def _db_path(audits_root: Path, slug: str) -> Path:
     return audits_root / slug / DB_FILENAME
 
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS variant_stats (
+    variant_set TEXT,
+    variant_id TEXT,
+    sent INTEGER DEFAULT 0,
+    opens INTEGER DEFAULT 0,
+    replies INTEGER DEFAULT 0,
+    meetings INTEGER DEFAULT 0,
+    last_updated TEXT,
+    PRIMARY KEY(variant_set, variant_id)
+)
+"""
+
+# One connection per learning db, opened on first use and shared across calls
+# and threads; _LOCK serializes access to them.
+_CONNS: Dict[str, sqlite3.Connection] = {}
+_LOCK = threading.RLock()
+
+# choose_variant's view of variant_stats, per db: key -> (version, stats by id).
+# _WRITES counts commits made through record_events (see _stats_by_id).
+_WRITES: Dict[str, int] = {}
+_STATS_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Tuple[int, int, int]]]] = {}
+_NO_STATS = (0, 0, 0)
+
+
+def _get_conn(dbpath: Path) -> sqlite3.Connection:
+    key = str(dbpath)
+    with _LOCK:
+        conn = _CONNS.get(key)
+        if conn is None:
+            dbpath.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(key, check_same_thread=False, cached_statements=256)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute(_SCHEMA)
+            conn.commit()
+            _CONNS[key] = conn
+        return conn
+
+
+def close_connections() -> None:
+    with _LOCK:
+        conns = list(_CONNS.values())
+        _CONNS.clear()
+        _STATS_CACHE.clear()  # data_version is per connection
+    for conn in conns:
+        conn.close()
+
+
+atexit.register(close_connections)
+
+
 def init_learning_db(dbpath: Path) -> None:
-    dbpath.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(dbpath))
-    cur = conn.cursor()
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS variant_stats (
-            variant_set TEXT,
-            variant_id TEXT,
-            sent INTEGER DEFAULT 0,
-            opens INTEGER DEFAULT 0,
-            replies INTEGER DEFAULT 0,
-            meetings INTEGER DEFAULT 0,
-            last_updated TEXT,
-            PRIMARY KEY(variant_set, variant_id)
-        )
-        """
+    # _get_conn creates the schema when it first opens a db, so once a
+    # connection is cached there is nothing left to do here.
+    _get_conn(dbpath)
+
+
+# Event kind -> variant_stats counter column.
+KIND_COLUMNS: Dict[str, str] = {
+    "sent": "sent",
+    "opened": "opens",
+    "open": "opens",
+    "replied": "replies",
+    "reply": "replies",
+    "meeting": "meetings",
+    "booked_meeting": "meetings",
+}
+
+# One fully formed UPSERT per counter column: creates the row or bumps the
+# counter in a single statement, and the SQL text never varies per call.
+_UPSERT_SQL: Dict[str, str] = {
+    col: (
+        f"INSERT INTO variant_stats(variant_set, variant_id, {col}, last_updated) VALUES (?, ?, ?, {_SQL_NOW}) "
+        f"ON CONFLICT(variant_set, variant_id) DO UPDATE SET {col} = COALESCE({col},0) + excluded.{col}, last_updated = excluded.last_updated"
     )
-    conn.commit()
-    conn.close()
+    for col in ("sent", "opens", "replies", "meetings")
+}
 
 
-def _inc_stat(dbpath: Path, variant_set: str, variant_id: str, col: str, delta: int = 1) -> None:
-    init_learning_db(dbpath)
-    conn = sqlite3.connect(str(dbpath))
-    cur = conn.cursor()
-    now = datetime.utcnow().isoformat()
-    # ensure row exists
-    cur.execute("INSERT OR IGNORE INTO variant_stats(variant_set, variant_id, last_updated) VALUES (?, ?, ?)", (variant_set, variant_id, now))
-    cur.execute(f"UPDATE variant_stats SET {col} = COALESCE({col},0) + ?, last_updated = ? WHERE variant_set=? AND variant_id=?", (delta, now, variant_set, variant_id))
-    conn.commit()
-    conn.close()
+# Read statements as constants so the connection's statement cache reuses them
+_STATS_COLUMNS = ("variant_set", "variant_id", "sent", "opens", "replies", "meetings", "last_updated")
+_SQL_STATS = f"SELECT {', '.join(_STATS_COLUMNS)} FROM variant_stats ORDER BY variant_set, variant_id"
+_SQL_STATS_BY_ID = "SELECT variant_id, sent, replies, meetings FROM variant_stats ORDER BY variant_set, variant_id"
+_SQL_DATA_VERSION = "PRAGMA data_version"
+
+
+def record_events(dbpath: Path, events: Iterable[Tuple[str, str, str]]) -> None:
+    """Apply many (variant_set, variant_id, kind) events in one transaction.
+
+    Events without a variant_id or with an unknown kind are ignored, as in
+    record_event. Repeats of the same variant/counter are summed first.
+    """
+    deltas: Counter = Counter()
+    for variant_set, variant_id, kind in events:
+        col = KIND_COLUMNS.get(kind)
+        if variant_id and col:
+            deltas[(col, variant_set or "baseline", variant_id)] += 1
+    if not deltas:
+        return
+    by_col: Dict[str, List[Tuple[str, str, int]]] = {}
+    for (col, variant_set, variant_id), n in deltas.items():
+        by_col.setdefault(col, []).append((variant_set, variant_id, n))
+    conn = _get_conn(dbpath)  # schema is created on first open
+    key = str(dbpath)
+    with _LOCK:
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            for col, rows in by_col.items():
+                conn.executemany(_UPSERT_SQL[col], rows)
+        _WRITES[key] = _WRITES.get(key, 0) + 1
 
 
 def record_event(dbpath: Path, variant_set: str, variant_id: str, kind: str) -> None:
     """Increment stats based on event kind: 'sent','opened','replied','meeting'."""
-    if not variant_id:
-        return
-    col = None
-    if kind == "sent":
-        col = "sent"
-    elif kind in ("opened", "open"):
-        col = "opens"
-    elif kind in ("replied", "reply"):
-        col = "replies"
-    elif kind in ("meeting", "booked_meeting"):
-        col = "meetings"
-    if col:
-        _inc_stat(dbpath, variant_set or "baseline", variant_id, col, 1)
+    record_events(dbpath, [(variant_set, variant_id, kind)])
 
 
 def get_stats(dbpath: Path) -> List[Dict[str, Any]]:
     if not dbpath.exists():
         return []
-    conn = sqlite3.connect(str(dbpath))
-    cur = conn.cursor()
-    cur.execute("SELECT variant_set, variant_id, sent, opens, replies, meetings, last_updated FROM variant_stats ORDER BY variant_set, variant_id")
-    rows = [dict(zip(["variant_set", "variant_id", "sent", "opens", "replies", "meetings", "last_updated"], r)) for r in cur.fetchall()]
-    conn.close()
+    conn = _get_conn(dbpath)
+    with _LOCK:
+        cur = conn.execute(_SQL_STATS)
+        rows = [dict(zip(_STATS_COLUMNS, r)) for r in cur.fetchall()]
     return rows
 
 
-def choose_variant(variants: List[Variant], audits_root: Path, client_slug: str, variant_set: str = "baseline", epsilon: float = 0.1) -> Optional[Variant]:
-    """Epsilon-greedy: with prob epsilon pick random variant, else pick best-performing variant by (replies+meetings)/sent.
+def _stats_by_id(dbpath: Path) -> Dict[str, Tuple[int, int, int]]:
+    """variant_id -> (sent, replies, meetings), re-read only when the db changed.
 
-    If no stats exist, prefer the first variant (baseline) but allow exploration.
+    Commits made through this module bump _WRITES; PRAGMA data_version moves
+    when any other connection (or process) commits to the file.
+    """
+    key = str(dbpath)
+    conn = _get_conn(dbpath)
+    with _LOCK:
+        version = (_WRITES.get(key, 0), conn.execute(_SQL_DATA_VERSION).fetchone()[0])
+        hit = _STATS_CACHE.get(key)
+        if hit is not None and hit[0] == version:
+            return hit[1]
+        cur = conn.execute(_SQL_STATS_BY_ID)
+        by_id = {vid: (sent or 0, replies or 0, meetings or 0) for vid, sent, replies, meetings in cur.fetchall()}
+        _STATS_CACHE[key] = (version, by_id)
+        return by_id
+
+
+def choose_variant(variants: List[Variant], audits_root: Path, client_slug: str, variant_set: str = "baseline", epsilon: float = 0.0) -> Optional[Variant]:
+    """Thompson sampling over (replies+meetings)/sent with a Beta(1, 1) prior.
+
+    Each variant draws from Beta(1 + wins, 1 + sent - wins) and the highest
+    draw wins, so exploration concentrates on variants whose rate is still
+    uncertain. Until any variant has been sent, the first (baseline) is
+    returned. With probability epsilon a uniformly random variant is picked
+    instead (off by default).
     """
     if not variants:
         return None
     dbpath = _db_path(audits_root, client_slug)
     init_learning_db(dbpath)
     # exploration
-    if random.random() < epsilon:
+    if epsilon and random.random() < epsilon:
         return random.choice(variants)
 
-    # compute scores
-    stats = {r["variant_id"]: r for r in get_stats(dbpath)}
-    best = None
-    best_score = -1.0
-    for v in variants:
-        s = stats.get(v.id, {})
-        sent = s.get("sent", 0) or 0
-        replies = s.get("replies", 0) or 0
-        meetings = s.get("meetings", 0) or 0
-        # conversion-like metric
-        score = (replies + meetings) / sent if sent else 0.0
-        if score > best_score:
-            best_score = score
-            best = v
-
+    stats = _stats_by_id(dbpath)
+    arms = [(v, stats.get(v.id, _NO_STATS)) for v in variants]
     # If all untried, return first variant
-    if best is None:
+    if not any(counts[0] for _, counts in arms):
         return variants[0]
+    best = variants[0]
+    best_draw = -1.0
+    for v, (sent, replies, meetings) in arms:
+        wins = replies + meetings
+        draw = random.betavariate(1 + wins, 1 + max(0, sent - wins))
+        if draw > best_draw:
+            best_draw = draw
+            best = v
     return best
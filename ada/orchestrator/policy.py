@@ -1,5 +1,8 @@
 from __future__ import annotations
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from functools import lru_cache
+from operator import itemgetter
+import heapq
 from ada.core.schemas import OutreachPlan, Contact
 from datetime import datetime
 import re
@@ -8,15 +11,23 @@ import re
 _HHMM = re.compile(r"^(\d{2}):(\d{2})-(\d{2}):(\d{2})$")
 
 
+@lru_cache(maxsize=16)
+def _parse_qh(quiet_hours: str) -> Optional[Tuple[int, int]]:
+    """"HH:MM-HH:MM" -> (start, end) in minutes since midnight, None if malformed."""
+    m = _HHMM.match(quiet_hours.strip())
+    if not m:
+        return None
+    sh, sm, eh, em = map(int, m.groups())
+    return sh * 60 + sm, eh * 60 + em
+
+
 def _in_quiet_hours(now: datetime, quiet_hours: str | None) -> bool:
     if not quiet_hours:
         return False
-    m = _HHMM.match(quiet_hours.strip())
-    if not m:
+    window = _parse_qh(quiet_hours)
+    if window is None:
         return False
-    sh, sm, eh, em = map(int, m.groups())
-    start = sh * 60 + sm
-    end = eh * 60 + em
+    start, end = window
     cur = now.hour * 60 + now.minute
     if start <= end:
         return start <= cur < end
@@ -47,9 +58,10 @@ def build_plan(
     now = now or datetime.utcnow()
     reasons: Dict[str, str] = {}
 
-    allowlist = set(overrides.get("allowlist", []) or [])
-    blocklist = set(overrides.get("blocklist", []) or [])
-    domain_caps: Dict[str, int] = overrides.get("domain_caps", {}) or {}
+    # Normalize list entries and cap domains once, so matching is case-insensitive
+    allowlist = frozenset(s.strip().casefold() for s in overrides.get("allowlist") or ())
+    blocklist = frozenset(s.strip().casefold() for s in overrides.get("blocklist") or ())
+    domain_caps: Dict[str, int] = {d.strip().casefold(): n for d, n in (overrides.get("domain_caps") or {}).items()}
     quiet_hours = overrides.get("quiet_hours")  # "HH:MM-HH:MM" (UTC)
 
     # Quiet hours: if active, return empty selection but include reasons on all
@@ -64,34 +76,36 @@ def build_plan(
         )
         return plan
 
-    # Filter by email presence
-    pool: List[Contact] = [c for c in contacts if c.email]
-    # Apply allow/block lists
-    def email_or_domain(val: str) -> str:
-        return val.lower().strip()
-
-    selected: List[Contact] = []
-    for c in pool:
-        em = c.email or ""
-        dom = em.split("@")[-1].lower() if "@" in em else em.lower()
-        entry = email_or_domain(em)
+    # One pass: drop contacts without email, apply allow/block lists, and keep
+    # (score, contact, domain) so later steps don't re-derive them.
+    selected: List[Tuple[float, Contact, str]] = []
+    for c in contacts:
+        em = c.email
+        if not em:
+            continue
+        dom = em.rpartition("@")[2].casefold()  # whole address when there is no "@"
+        entry = em.strip().casefold()
         if blocklist and (entry in blocklist or dom in blocklist):
             reasons[c.id] = "blocklisted"
             continue
         if allowlist and not (entry in allowlist or dom in allowlist):
             reasons[c.id] = "not-allowlisted"
             continue
-        selected.append(c)
+        selected.append((c.score or 0.0, c, dom))
 
-    # Sort by score desc
-    selected.sort(key=lambda c: (c.score or 0.0), reverse=True)
+    # Sort by score desc. Without domain caps only the first `want` entries can
+    # ever be taken, so a partial top-k selection (same order, ties included)
+    # replaces the full sort when the pool is much larger than that.
+    want = daily_cap if limit is None else min(daily_cap, limit)
+    if not domain_caps and 0 <= want and len(selected) > 4 * want:
+        selected = heapq.nlargest(want, selected, key=itemgetter(0))
+    else:
+        selected.sort(key=itemgetter(0), reverse=True)
 
     # Enforce per-domain caps
     taken_by_domain: Dict[str, int] = {}
     capped: List[Contact] = []
-    for c in selected:
-        em = c.email or ""
-        dom = em.split("@")[-1].lower() if "@" in em else em.lower()
+    for _, c, dom in selected:
         cap = domain_caps.get(dom)
         if cap is None:
             capped.append(c)
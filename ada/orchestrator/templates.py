@@ -1,26 +1,60 @@
 from __future__ import annotations
 from ada.core.schemas import Contact
-from typing import Tuple, Optional
+from typing import Any, Callable, Dict, Tuple, Optional
+from functools import lru_cache
+from string import Formatter
 from ada.learning.variants import Variant
 
+_FORMATTER = Formatter()
+
+
+@lru_cache(maxsize=512)
+def _compile(tpl: str) -> Callable[[Dict[str, Any]], str]:
+    """Return a renderer equivalent to tpl.format_map, parsing the template once.
+
+    Templates made only of bare {name} fields render by joining the pre-split
+    pieces; anything else (format specs, conversions, positional or dotted
+    fields, malformed braces) is left to str.format_map.
+    """
+    try:
+        parts = list(_FORMATTER.parse(tpl))
+    except ValueError:
+        return tpl.format_map  # raises the same error when rendered
+    if any(fn is not None and (not fn.isidentifier() or spec or conv) for _, fn, spec, conv in parts):
+        return tpl.format_map
+    pieces = [(lit, fn) for lit, fn, _, _ in parts]
+
+    def render(ctx: Dict[str, Any]) -> str:
+        out = []
+        for lit, fn in pieces:
+            out.append(lit)
+            if fn is not None:
+                out.append(str(ctx[fn]))  # KeyError for unknown fields, like str.format
+        return "".join(out)
+
+    return render
+
+
+@lru_cache(maxsize=64)
+def _subject_prefix(brand_voice: str | None) -> str:
+    return "Quick question" if not brand_voice else brand_voice.split(",")[0]
+
+
+@lru_cache(maxsize=64)
+def _body_frame(brand_voice: str | None, offer: Optional[str]) -> Tuple[str, str]:
+    """Text before and after the per-contact greeting line of render_body."""
+    head = f"Tone: {brand_voice}\n\n" if brand_voice else ""
+    tail = "\n\n" + (offer or "I wanted to share something I think will help your team.") + "\n\nBest,\nYour team"
+    return head, tail
+
 
 def render_subject(contact: Contact, brand_voice: str | None = None, offer: str | None = None) -> str:
-    prefix = "Quick question" if not brand_voice else brand_voice.split(",")[0]
-    name = contact.first_name or contact.email or "there"
-    return f"{prefix} for {name}"
+    return f"{_subject_prefix(brand_voice)} for {contact.first_name or contact.email or 'there'}"
 
 
 def render_body(contact: Contact, brand_voice: str | None = None, offer: Optional[str] = None) -> str:
-    lines = []
-    if brand_voice:
-        lines.append(f"Tone: {brand_voice}")
-    lines.append(f"Hi {contact.first_name or contact.email or 'there'},")
-    if offer:
-        lines.append(offer)
-    else:
-        lines.append("I wanted to share something I think will help your team.")
-    lines.append("Best,\nYour team")
-    return "\n\n".join(lines)
+    head, tail = _body_frame(brand_voice, offer)
+    return f"{head}Hi {contact.first_name or contact.email or 'there'},{tail}"
 
 
 def render(contact: Contact, brand_voice: str | None = None, offer: str | None = None) -> Tuple[str, str]:
@@ -40,11 +74,11 @@ def render_variant(contact: Contact, variant: Variant) -> Tuple[str, str]:
         "email": contact.email,
     }
     try:
-        subj = variant.subject_tpl.format(**ctx)
+        subj = _compile(variant.subject_tpl)(ctx)
     except Exception:
         subj = variant.name
     try:
-        body = variant.body_tpl.format(**ctx)
+        body = _compile(variant.body_tpl)(ctx)
     except Exception:
         body = f"Hi {contact.first_name or contact.email or 'there'},\n\n{variant.name}"
     return subj, body
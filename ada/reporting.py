@@ -2,25 +2,25 @@ from __future__ import annotations
 from pathlib import Path
 import json
 from datetime import datetime, timezone
+import numpy as np
+from html import escape
 import pandas as pd
-from tabulate import tabulate
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
 try:
     import markdown as _markdown
 except Exception:
     _markdown = None
 
-def _percentile(s: pd.Series, q: float) -> float:
-    try:
-        return float(s.quantile(q))
-    except Exception:
-        return 0.0
-
 def _owner_imbalance_pct(df: pd.DataFrame) -> float:
     """Simple load-imbalance across owners: (max_count - mean)/mean * 100."""
-    if "ownerId" not in df.columns or df["ownerId"].dropna().eq("").all():
+    if "ownerId" not in df.columns:
         return 0.0
     counts = df["ownerId"].fillna("").value_counts()
-    if counts.empty:
+    # No owners at all: empty frame, or every id missing/blank
+    if counts.empty or (len(counts) == 1 and counts.index[0] == ""):
         return 0.0
     mean = counts.mean()
     maxc = counts.max()
@@ -28,27 +28,89 @@ def _owner_imbalance_pct(df: pd.DataFrame) -> float:
         return 0.0
     return round(float((maxc - mean) / mean * 100.0), 2)
 
+# Epoch milliseconds beyond datetime64[ns]'s range (~year 2262)
+_MAX_EPOCH_MS = float(pd.Timestamp.max.value // 1_000_000)
+
+def _utc_values(ts: pd.Series) -> np.ndarray:
+    # tz-aware -> naive UTC datetime64[us], whatever unit pandas parsed into
+    return ts.to_numpy(dtype="datetime64[us]")
+
+def _epoch_ms_values(col: pd.Series) -> np.ndarray:
+    ms = pd.to_numeric(col, errors="coerce").astype("float64")  # exact below 2**53 ms
+    ms = ms.where(ms < _MAX_EPOCH_MS)  # to_datetime overflows instead of coercing
+    return _utc_values(pd.to_datetime(ms, errors="coerce", utc=True, unit="ms"))
+
+def _lastmodified_utc(col: pd.Series) -> np.ndarray:
+    """lastmodifieddate as naive UTC datetime64 values (NaT when unparseable).
+
+    HubSpot sends ISO-8601 strings or epoch milliseconds. ISO text goes through
+    the C parser; all-digit values are read as epoch ms; anything else left
+    over falls back to per-element parsing.
+    """
+    if pd.api.types.is_numeric_dtype(col.dtype):
+        return _epoch_ms_values(col)
+    if not (col.dtype == object or isinstance(col.dtype, pd.StringDtype)):
+        return _utc_values(pd.to_datetime(col, errors="coerce", utc=True))
+    # Naming the format keeps pandas on its C parser instead of per-element inference
+    values = _utc_values(pd.to_datetime(col, errors="coerce", utc=True, format="ISO8601", cache=True))
+    pos = np.flatnonzero(np.isnat(values) & col.notna().to_numpy())
+    if len(pos):
+        left = col.iloc[pos]
+        epoch = left.astype(str).str.fullmatch(r"\d+").to_numpy(dtype=bool)
+        values[pos[epoch]] = _epoch_ms_values(left[epoch])
+        values[pos[~epoch]] = _utc_values(pd.to_datetime(left[~epoch], errors="coerce", utc=True, format="mixed"))
+    return values
+
 def _dormant_mask(df: pd.DataFrame, days: int = 180) -> pd.Series:
     """Dormant if lastmodifieddate older than N days or missing."""
     if "lastmodifieddate" not in df.columns:
-        return pd.Series([True] * len(df))
-    ts = pd.to_datetime(df["lastmodifieddate"], errors="coerce", utc=True)
-    cutoff = pd.Timestamp.now(tz="UTC") - pd.Timedelta(days=days)
-    return ts.isna() | (ts < cutoff)
+        return pd.Series(True, index=df.index)
+    values = _lastmodified_utc(df["lastmodifieddate"])
+    cutoff = (pd.Timestamp.now(tz="UTC") - pd.Timedelta(days=days)).tz_convert(None).to_datetime64()
+    # Compare raw UTC datetime64 values (NaT never compares less, so add it explicitly)
+    return pd.Series(np.isnat(values) | (values < cutoff), index=df.index)
+
+def _cells(head: pd.DataFrame):
+    """Rows of `head` as display strings, with missing values blanked."""
+    for row in head.itertuples(index=False, name=None):
+        yield ["" if v is None or (isinstance(v, float) and v != v) or v is pd.NA or v is pd.NaT else str(v) for v in row]
+
+def _markdown_table(head: pd.DataFrame) -> str:
+    """GitHub-flavoured markdown table for a handful of rows."""
+    cols = [str(c) for c in head.columns]
+    lines = ["| " + " | ".join(cols) + " |", "|" + "|".join("---" for _ in cols) + "|"]
+    lines.extend("| " + " | ".join(v.replace("|", "\\|") for v in row) + " |" for row in _cells(head))
+    return "\n".join(lines)
+
+def _html_table(head: pd.DataFrame) -> str:
+    th = "".join(f"<th>{escape(str(c))}</th>" for c in head.columns)
+    trs = "".join("<tr>" + "".join(f"<td>{escape(v)}</td>" for v in row) + "</tr>" for row in _cells(head))
+    return f"<table><thead><tr>{th}</tr></thead><tbody>{trs}</tbody></table>"
 
-def write_outputs(df: pd.DataFrame, out_dir: str = "reports", *, pure_html: bool = False):
+def write_outputs(df: pd.DataFrame, out_dir: str = "reports", *, pure_html: bool = False, sort_scores: bool = True, scores_format: str = "jsonl"):
     out = Path(out_dir)
     out.mkdir(parents=True, exist_ok=True)
 
     # Defensive: sort by lead_score only if present (score_contacts normally adds it)
-    top = df.sort_values("lead_score", ascending=False) if "lead_score" in df.columns else df
+    has_lead = "lead_score" in df.columns
+    # sort_scores=False keeps lead_scores.* in input order and only selects the
+    # Top 10 (partial selection instead of a full sort)
+    top = df.sort_values("lead_score", ascending=False) if has_lead and sort_scores else df
+    # Column aggregates are computed once and reused by every output below
+    mean_lead = round(float(df["lead_score"].mean()), 2) if has_lead else None
+    pct_email = round(float(df["email"].notna().mean() * 100), 2) if "email" in df.columns else None
+    head = df.nlargest(10, "lead_score") if has_lead and not sort_scores else top.head(10)
     top.to_csv(out / "lead_scores.csv", index=False)
-    top.to_json(out / "lead_scores.jsonl", orient="records", lines=True)
+    if scores_format == "parquet":
+        # Columnar and compressed; needs pyarrow (or fastparquet) installed
+        top.to_parquet(out / "lead_scores.parquet", index=False, compression="zstd")
+    else:
+        top.to_json(out / "lead_scores.jsonl", orient="records", lines=True)
 
     insights = pd.DataFrame([
         {"metric": "total_contacts", "value": int(len(df))},
-        {"metric": "avg_lead_score", "value": round(float(df["lead_score"].mean()), 2) if "lead_score" in df.columns else None},
-        {"metric": "pct_has_email", "value": round(float(df["email"].notna().mean() * 100), 2) if "email" in df.columns else None},
+        {"metric": "avg_lead_score", "value": mean_lead},
+        {"metric": "pct_has_email", "value": pct_email},
     ])
     insights.to_json(out / "insights.jsonl", orient="records", lines=True)
 
@@ -56,26 +118,30 @@ def write_outputs(df: pd.DataFrame, out_dir: str = "reports", *, pure_html: bool
         "# ADA Analysis Summary",
         "",
         f"- Total contacts: **{len(df)}**",
-        f"- Avg lead score: **{round(float(df['lead_score'].mean()),2)}**" if "lead_score" in df.columns else "- Avg lead score: N/A",
+        f"- Avg lead score: **{mean_lead}**" if has_lead else "- Avg lead score: N/A",
         "",
         "## Top 10 Contacts",
         "",
-        tabulate(top.head(10).fillna(""), headers="keys", tablefmt="github"),
+        _markdown_table(head),
     ]
     (out / "summary.md").write_text("\n".join(summary_md), encoding="utf-8")
 
     # NEW: summary.json for master dashboard
     contacts = int(len(df))
-    lead = df["lead_score"] if "lead_score" in df.columns else pd.Series([0] * contacts)
+    p50 = p90 = 0.0
+    if has_lead and contacts:
+        # Both percentiles from one partition of the raw float array
+        lead = df["lead_score"].to_numpy(dtype="float64", na_value=np.nan)
+        p50, p90 = (float(q) for q in np.nanquantile(lead, [0.5, 0.9]))
     dormant = _dormant_mask(df)
     dormant_count = int(dormant.sum())
     dormant_pct = round(float((dormant_count / contacts) * 100.0), 2) if contacts else 0.0
 
     summary_json = {
         "contacts": contacts,
-        "mean_quality": round(float(lead.mean()), 2) if contacts else 0.0,
-        "p50_quality": round(_percentile(lead, 0.50), 2),
-        "p90_quality": round(_percentile(lead, 0.90), 2),
+        "mean_quality": (mean_lead if has_lead else 0.0) if contacts else 0.0,
+        "p50_quality": round(p50, 2),
+        "p90_quality": round(p90, 2),
         "dormant_count": dormant_count,
         "dormant_pct": dormant_pct,
         "owner_imbalance_pct": _owner_imbalance_pct(df),
@@ -85,7 +151,8 @@ def write_outputs(df: pd.DataFrame, out_dir: str = "reports", *, pure_html: bool
     try:
         outreach_file = out / "outreach_metrics.json"
         if outreach_file.exists():
-            outreach = json.loads(outreach_file.read_text(encoding="utf-8"))
+            raw = outreach_file.read_bytes()
+            outreach = _orjson.loads(raw) if _orjson is not None else json.loads(raw)
             # copy known fields into summary
             for k in ("contacted", "replies", "meetings", "open_rate", "reply_rate", "conversion_rate"):
                 if k in outreach:
@@ -100,13 +167,16 @@ def write_outputs(df: pd.DataFrame, out_dir: str = "reports", *, pure_html: bool
     except Exception:
         # non-fatal
         pass
-    (out / "summary.json").write_text(json.dumps(summary_json, indent=2), encoding="utf-8")
+    if _orjson is not None:
+        (out / "summary.json").write_bytes(_orjson.dumps(summary_json, option=_orjson.OPT_INDENT_2 | _orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        (out / "summary.json").write_text(json.dumps(summary_json, indent=2), encoding="utf-8")
 
     # Also emit an HTML version of the summary for nicer in-browser viewing.
     try:
         if pure_html:
             # Build a small, dependency-free HTML page.
-            table_html = tabulate(top.head(10).fillna(""), headers="keys", tablefmt="html")
+            table_html = _html_table(head)
             html_page = (
                 "<html><head><meta charset=\"utf-8\"><title>ADA Summary</title>"
                 "<style>body{font-family:system-ui,-apple-system,Segoe UI,Roboto,sans-serif;margin:32px}"
@@ -114,7 +184,7 @@ def write_outputs(df: pd.DataFrame, out_dir: str = "reports", *, pure_html: bool
                 "</head><body>"
                 f"<h1>ADA Analysis Summary</h1>"
                 f"<p>Total contacts: <strong>{len(df)}</strong></p>"
-                + (f"<p>Avg lead score: <strong>{round(float(df['lead_score'].mean()),2)}</strong></p>" if "lead_score" in df.columns else "<p>Avg lead score: N/A</p>")
+                + (f"<p>Avg lead score: <strong>{mean_lead}</strong></p>" if has_lead else "<p>Avg lead score: N/A</p>")
                 + "<h2>Top 10 Contacts</h2>"
                 + table_html
                 + "</body></html>"
@@ -1,174 +1,486 @@
 from __future__ import annotations
+import atexit
 import sqlite3
+from functools import lru_cache
+import threading
 from pathlib import Path
 import json
-from typing import Optional, List, Dict
-from datetime import datetime
+import os
+import queue
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from datetime import datetime, timedelta, timezone
 from ada.core import schemas
+from ada.learning.variants import KIND_COLUMNS as _KIND_COL
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
+
+
+# Connections are opened once per (thread, db file) and reused, so small ops
+# skip connect/close and keep SQLite's page cache warm. close_all() closes
+# every cached connection and bumps the generation so threads reopen lazily.
+_TLS = threading.local()
+_OPEN: List[sqlite3.Connection] = []
+_OPEN_LOCK = threading.Lock()
+_GENERATION = 0
+
+
+# Hot statements as module-level constants so each connection's statement
+# cache (cached_statements) is hit on every call.
+_SQL_SAVE_MESSAGE = """
+INSERT INTO messages(id, client_slug, contact_id, role, channel, subject, body, ts, status, meta, variant_id, variant_set)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET status=excluded.status, meta=excluded.meta,
+    variant_id=COALESCE(excluded.variant_id, variant_id), variant_set=COALESCE(excluded.variant_set, variant_set)
+"""
+_SQL_UPDATE_STATUS = "UPDATE messages SET status=?, meta=? WHERE id=?"
+_SQL_LOG_EVENT = "INSERT OR REPLACE INTO events(id, client_slug, kind, message_id, contact_id, ts, meta, ts_us) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+# Timestamps come from SQLite itself (UTC, millisecond precision) so no
+# Python datetime is built per update.
+_SQL_NOW = "strftime('%Y-%m-%dT%H:%M:%f','now')"
+# Variant stats are keyed straight off the message's variant columns, so an
+# event never needs the message's meta decoded.
+_SQL_ENSURE_VARIANT = (
+    f"INSERT OR IGNORE INTO variant_stats(variant_set, variant_id, last_updated) "
+    f"SELECT variant_set, variant_id, {_SQL_NOW} FROM messages WHERE id=? AND variant_id IS NOT NULL AND variant_id != ''"
+)
+# One prepared UPDATE per counter column (params: increment, message id).
+_UPDATE_SQL = {
+    col: (
+        f"UPDATE variant_stats SET {col} = COALESCE({col},0) + ?, last_updated = {_SQL_NOW} "
+        "WHERE (variant_set, variant_id) = (SELECT variant_set, variant_id FROM messages WHERE id=?)"
+    )
+    for col in ("sent", "opens", "replies", "meetings")
+}
+# Ids per IN (...) list, well under SQLite's bound-parameter limit
+_IN_CHUNK = 500
+MESSAGE_COLUMNS = ("id", "client_slug", "contact_id", "role", "channel", "subject", "body", "ts", "status", "meta")
+_SQL_LAST_REPLY = "SELECT ts_us, ts FROM events WHERE kind='replied' ORDER BY ts_us DESC LIMIT 1"
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id TEXT PRIMARY KEY,
+    client_slug TEXT,
+    contact_id TEXT,
+    role TEXT,
+    channel TEXT,
+    subject TEXT,
+    body TEXT,
+    ts TEXT,
+    status TEXT,
+    meta TEXT,
+    variant_id TEXT,
+    variant_set TEXT
+);
+CREATE TABLE IF NOT EXISTS events (
+    id TEXT PRIMARY KEY,
+    client_slug TEXT,
+    kind TEXT,
+    message_id TEXT,
+    contact_id TEXT,
+    ts TEXT,
+    meta TEXT,
+    ts_us INTEGER
+);
+CREATE TABLE IF NOT EXISTS variant_stats (
+    variant_set TEXT,
+    variant_id TEXT,
+    sent INTEGER DEFAULT 0,
+    opens INTEGER DEFAULT 0,
+    replies INTEGER DEFAULT 0,
+    meetings INTEGER DEFAULT 0,
+    last_updated TEXT,
+    PRIMARY KEY(variant_set, variant_id)
+);
+"""
+
+# Indexes run after _migrate so they may reference migrated columns.
+_INDEXES = """
+-- fetch_pending and the outreach metrics filter messages by status and
+-- group by channel; (status, channel) lets both run from the index.
+CREATE INDEX IF NOT EXISTS idx_messages_status_channel ON messages(status, channel);
+-- Partial index: reply counts per message only ever look at kind='replied'.
+CREATE INDEX IF NOT EXISTS idx_events_replied ON events(message_id) WHERE kind='replied';
+-- last_reply_ts: newest event of a kind is the last entry of its (kind, ts_us) range.
+CREATE INDEX IF NOT EXISTS idx_events_kind_ts_us ON events(kind, ts_us);
+"""
+
+
+# Columns added after the original schema: (table, column, type, backfill SQL).
+# Existing dbs get them via ALTER TABLE the first time they are opened.
+_MIGRATIONS = (
+    ("messages", "variant_id", "TEXT",
+     "UPDATE messages SET variant_id = json_extract(meta, '$.variant_id') WHERE json_valid(meta)"),
+    ("messages", "variant_set", "TEXT",
+     "UPDATE messages SET variant_set = COALESCE(json_extract(meta, '$.variant_set'), 'baseline') WHERE variant_id IS NOT NULL"),
+    # Event time as integer microseconds since the epoch (UTC), next to the ISO text in ts
+    ("events", "ts_us", "INTEGER",
+     "UPDATE events SET ts_us = ada_iso_to_us(ts)"),
+)
+
+
+def _pragmas() -> List[str]:
+    """Per-connection PRAGMAs; cache size is tunable via ADA_SQLITE_CACHE_MB (default 64)."""
+    cache_mb = int(os.getenv("ADA_SQLITE_CACHE_MB", "64"))
+    return [
+        # WAL is persisted in the file; NORMAL sync is the documented safe pairing for WAL
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        f"PRAGMA cache_size=-{cache_mb * 1024}",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA wal_autocheckpoint=1000",
+        "PRAGMA busy_timeout=5000",
+    ]
 
 
 def _connect(dbpath: Path) -> sqlite3.Connection:
-    dbpath.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(dbpath), detect_types=sqlite3.PARSE_DECLTYPES)
-    conn.row_factory = sqlite3.Row
+    conns = getattr(_TLS, "conns", None)
+    if conns is None or getattr(_TLS, "generation", None) != _GENERATION:
+        conns = _TLS.conns = {}
+        _TLS.generation = _GENERATION
+    key = str(dbpath)
+    conn = conns.get(key)
+    if conn is None:
+        dbpath.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(key, detect_types=sqlite3.PARSE_DECLTYPES, check_same_thread=False, cached_statements=256)
+        for pragma in _pragmas():
+            conn.execute(pragma)
+        # Schema once per connection instead of on every store call
+        conn.executescript(_SCHEMA)
+        _migrate(conn)
+        conn.executescript(_INDEXES)
+        conns[key] = conn
+        with _OPEN_LOCK:
+            _OPEN.append(conn)
     return conn
 
 
+def _migrate(conn: sqlite3.Connection) -> None:
+    conn.create_function("ada_iso_to_us", 1, _iso_to_us, deterministic=True)
+    columns: Dict[str, set] = {}
+    for table, column, decl, backfill in _MIGRATIONS:
+        if table not in columns:
+            columns[table] = {r[1] for r in conn.execute(f"PRAGMA table_info({table})")}
+        if column in columns[table]:
+            continue
+        try:
+            with conn:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+                conn.execute(backfill)
+        except sqlite3.OperationalError as e:
+            # another connection migrated first
+            if "duplicate column" not in str(e):
+                raise
+        columns[table].add(column)
+
+
+def close_all() -> None:
+    """Close every cached connection (all threads). Safe to call repeatedly."""
+    global _GENERATION
+    with _OPEN_LOCK:
+        conns = list(_OPEN)
+        _OPEN.clear()
+        _GENERATION += 1
+    for conn in conns:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+
+atexit.register(close_all)
+
+
 def init_db(dbpath: Path) -> None:
-    conn = _connect(dbpath)
-    cur = conn.cursor()
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS messages (
-            id TEXT PRIMARY KEY,
-            client_slug TEXT,
-            contact_id TEXT,
-            role TEXT,
-            channel TEXT,
-            subject TEXT,
-            body TEXT,
-            ts TEXT,
-            status TEXT,
-            meta TEXT
-        )
-        """
-    )
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS events (
-            id TEXT PRIMARY KEY,
-            client_slug TEXT,
-            kind TEXT,
-            message_id TEXT,
-            contact_id TEXT,
-            ts TEXT,
-            meta TEXT
-        )
-        """
-    )
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS variant_stats (
-            variant_set TEXT,
-            variant_id TEXT,
-            sent INTEGER DEFAULT 0,
-            opens INTEGER DEFAULT 0,
-            replies INTEGER DEFAULT 0,
-            meetings INTEGER DEFAULT 0,
-            last_updated TEXT,
-            PRIMARY KEY(variant_set, variant_id)
-        )
-        """
+    # The schema is applied when _connect first opens a db, so this only
+    # needs to make sure a connection exists.
+    _connect(dbpath)
+
+
+def _dumps(obj) -> str:
+    """Compact JSON text for a meta dict; orjson when installed, stdlib otherwise."""
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _message_row(msg: schemas.Message) -> tuple:
+    meta = msg.meta or {}
+    variant_id = meta.get("variant_id") or None
+    return (
+        msg.id,
+        msg.client_slug,
+        msg.contact_id,
+        msg.role,
+        msg.channel,
+        msg.subject,
+        msg.body,
+        msg.ts.isoformat(),
+        msg.status,
+        _dumps(msg.meta),
+        variant_id,
+        meta.get("variant_set", "baseline") if variant_id else None,
     )
-    conn.commit(); conn.close()
+
+
+def _bulk(conn: sqlite3.Connection, sql: str, rows) -> None:
+    """Run `sql` for every parameter tuple in `rows` inside one write transaction."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.executemany(sql, rows)
+    except Exception:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
+def save_messages(dbpath: Path, msgs: Iterable[schemas.Message]) -> None:
+    """Insert or update many messages in a single transaction (one fsync, not one per row)."""
+    _bulk(_connect(dbpath), _SQL_SAVE_MESSAGE, (_message_row(m) for m in msgs))
 
 
 def save_message(dbpath: Path, msg: schemas.Message) -> None:
-    init_db(dbpath)
-    conn = _connect(dbpath)
-    cur = conn.cursor()
-    cur.execute(
-        """
-        INSERT INTO messages(id, client_slug, contact_id, role, channel, subject, body, ts, status, meta)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT(id) DO UPDATE SET status=excluded.status, meta=excluded.meta
-        """,
-        (
-            msg.id,
-            msg.client_slug,
-            msg.contact_id,
-            msg.role,
-            msg.channel,
-            msg.subject,
-            msg.body,
-            msg.ts.isoformat(),
-            msg.status,
-            json.dumps(msg.meta),
-        ),
-    )
-    conn.commit(); conn.close()
+    save_messages(dbpath, [msg])
+
+
+def update_statuses(dbpath: Path, message_ids: Iterable[str], status: str, meta: Optional[Dict] = None) -> None:
+    """Set the same status (and meta) on many messages in a single transaction."""
+    meta_text = _dumps(meta or {})
+    _bulk(_connect(dbpath), _SQL_UPDATE_STATUS, ((status, meta_text, mid) for mid in message_ids))
 
 
 def update_status(dbpath: Path, message_id: str, status: str, meta: Optional[Dict] = None) -> None:
-    init_db(dbpath)
-    conn = _connect(dbpath)
-    cur = conn.cursor()
-    cur.execute("UPDATE messages SET status=?, meta=? WHERE id=?", (status, json.dumps(meta or {}), message_id))
-    conn.commit(); conn.close()
+    update_statuses(dbpath, [message_id], status, meta)
 
 
-def log_event(dbpath: Path, ev: schemas.Event) -> None:
-    init_db(dbpath)
-    conn = _connect(dbpath)
-    cur = conn.cursor()
-    cur.execute(
-        "INSERT OR REPLACE INTO events(id, client_slug, kind, message_id, contact_id, ts, meta) VALUES (?, ?, ?, ?, ?, ?, ?)",
-        (ev.id, ev.client_slug, ev.kind, ev.message_id, ev.contact_id, ev.ts.isoformat(), json.dumps(ev.meta)),
-    )
-    conn.commit(); conn.close()
-    # Update variant stats if the message carried a variant_id in its meta
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = _EPOCH.replace(tzinfo=timezone.utc)
+_US = timedelta(microseconds=1)
+
+
+def _to_us(ts: datetime) -> int:
+    """Microseconds since the epoch; naive datetimes are taken as UTC (datetime.utcnow())."""
+    return (ts - (_EPOCH if ts.tzinfo is None else _EPOCH_UTC)) // _US
+
+
+def _iso_to_us(text: Optional[str]) -> Optional[int]:
     try:
-        if ev.message_id:
-            _update_variant_from_message(dbpath, ev.message_id, ev.kind)
-    except Exception:
-        # non-fatal: best-effort stats update
-        pass
+        return _to_us(datetime.fromisoformat(text))
+    except (TypeError, ValueError):
+        return None
+
+
+def _event_row(ev: schemas.Event) -> tuple:
+    return (ev.id, ev.client_slug, ev.kind, ev.message_id, ev.contact_id, ev.ts.isoformat(), _dumps(ev.meta), _to_us(ev.ts))
 
 
-def _update_variant_from_message(dbpath: Path, message_id: str, kind: str) -> None:
-    """Helper: find message by id, parse meta for variant_id/variant_set and increment variant_stats accordingly."""
-    init_db(dbpath)
+# Approval only flips status; meta (variant attribution) is left as drafted.
+_SQL_APPROVE_OLDEST_DRAFTS = (
+    "UPDATE messages SET status='approved' "
+    "WHERE id IN (SELECT id FROM messages WHERE status='draft' ORDER BY rowid LIMIT ?)"
+)
+
+
+def approve_messages(dbpath: Path, ids: Optional[Sequence[str]] = None, limit: int = 25) -> int:
+    """Approve the first `limit` of `ids`, or the oldest `limit` drafts when no ids are given.
+
+    Runs as one transaction and returns the number of messages updated.
+    """
     conn = _connect(dbpath)
-    cur = conn.cursor()
-    cur.execute("SELECT meta FROM messages WHERE id=?", (message_id,))
-    row = cur.fetchone()
-    if not row:
-        conn.close()
+    with conn:
+        if ids is None:
+            return conn.execute(_SQL_APPROVE_OLDEST_DRAFTS, (limit,)).rowcount
+        ids = list(ids)[:limit]
+        n = 0
+        for i in range(0, len(ids), _IN_CHUNK):
+            chunk = ids[i:i + _IN_CHUNK]
+            n += conn.execute(f"UPDATE messages SET status='approved' WHERE id IN ({','.join('?' * len(chunk))})", chunk).rowcount
+        return n
+
+
+def log_events(dbpath: Path, evs: Iterable[schemas.Event]) -> None:
+    """Insert many events in a single transaction, then update variant stats for them."""
+    evs = list(evs)
+    if not evs:
         return
-    try:
-        meta = json.loads(row[0] or "{}")
-    except Exception:
-        meta = {}
-    variant_id = meta.get("variant_id")
-    variant_set = meta.get("variant_set", "baseline")
-    if not variant_id:
-        conn.close()
+    _bulk(_connect(dbpath), _SQL_LOG_EVENT, (_event_row(ev) for ev in evs))
+    # Variant stats for messages that carried a variant_id are updated by the
+    # background writer; see flush_variant_stats().
+    _start_stats_worker()
+    for ev in evs:
+        if ev.message_id:
+            _STATS_Q.put((dbpath, ev.message_id, ev.kind))
+
+
+def log_event(dbpath: Path, ev: schemas.Event) -> None:
+    log_events(dbpath, [ev])
+
+
+def _update_variants_from_messages(dbpath: Path, events: Sequence[Tuple[str, str]]) -> None:
+    """Increment variant_stats for (message_id, kind) pairs via each message's variant_id/variant_set columns."""
+    counts: Dict[Tuple[str, str], int] = {}
+    for message_id, kind in events:
+        col = _KIND_COL.get(kind)
+        if col:
+            counts[(col, message_id)] = counts.get((col, message_id), 0) + 1
+    if not counts:
         return
-    now = datetime.utcnow().isoformat()
-    # ensure row
-    cur.execute("INSERT OR IGNORE INTO variant_stats(variant_set, variant_id, last_updated) VALUES (?, ?, ?)", (variant_set, variant_id, now))
-    col = None
-    if kind == "sent":
-        col = "sent"
-    elif kind in ("opened", "open"):
-        col = "opens"
-    elif kind in ("replied", "reply"):
-        col = "replies"
-    elif kind in ("meeting", "booked_meeting"):
-        col = "meetings"
-    if col:
-        cur.execute(f"UPDATE variant_stats SET {col} = COALESCE({col},0) + 1, last_updated = ? WHERE variant_set=? AND variant_id=?", (now, variant_set, variant_id))
-        conn.commit()
-    conn.close()
-
-
-def fetch_pending(dbpath: Path, status: str = "approved", limit: int = 100) -> List[Dict]:
-    init_db(dbpath)
+    by_col: Dict[str, List[Tuple[int, str]]] = {}
+    for (col, message_id), n in counts.items():
+        by_col.setdefault(col, []).append((n, message_id))
     conn = _connect(dbpath)
-    cur = conn.cursor()
-    cur.execute("SELECT * FROM messages WHERE status=? LIMIT ?", (status, limit))
-    rows = [dict(r) for r in cur.fetchall()]
-    conn.close()
-    return rows
+    # `with conn` commits on success and rolls back on error, so the reused
+    # connection is never left inside an open transaction.
+    with conn:
+        conn.executemany(_SQL_ENSURE_VARIANT, [(mid,) for mid in dict.fromkeys(mid for _, mid in counts)])
+        for col, rows in by_col.items():
+            conn.executemany(_UPDATE_SQL[col], rows)
+
+
+# Write-behind queue for variant_stats: items are (dbpath, message_id, kind),
+# or a threading.Event that flush_variant_stats() waits on. One daemon thread
+# drains up to _STATS_BATCH items (or whatever arrives within _STATS_LINGER
+# seconds) and applies them in one transaction per db.
+_STATS_Q: "queue.SimpleQueue" = queue.SimpleQueue()
+_STATS_BATCH = 256
+_STATS_LINGER = 0.05
+_STATS_WORKER: Optional[threading.Thread] = None
+_STATS_WORKER_LOCK = threading.Lock()
+
+
+def _stats_worker() -> None:
+    while True:
+        item = _STATS_Q.get()
+        batch: List[Tuple[Path, str, str]] = []
+        waiters: List[threading.Event] = []
+        deadline = time.monotonic() + _STATS_LINGER
+        while True:
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+                break  # everything queued before the flush marker is in `batch`
+            batch.append(item)
+            remaining = deadline - time.monotonic()
+            if len(batch) >= _STATS_BATCH or remaining <= 0:
+                break
+            try:
+                item = _STATS_Q.get(timeout=remaining)
+            except queue.Empty:
+                break
+        by_db: Dict[Path, List[Tuple[str, str]]] = {}
+        for dbpath, message_id, kind in batch:
+            by_db.setdefault(dbpath, []).append((message_id, kind))
+        for dbpath, events in by_db.items():
+            try:
+                _update_variants_from_messages(dbpath, events)
+            except Exception:
+                # non-fatal: best-effort stats update
+                pass
+        for w in waiters:
+            w.set()
+
+
+def _start_stats_worker() -> None:
+    global _STATS_WORKER
+    if _STATS_WORKER is not None:
+        return
+    with _STATS_WORKER_LOCK:
+        if _STATS_WORKER is None:
+            t = threading.Thread(target=_stats_worker, name="ada-variant-stats", daemon=True)
+            t.start()
+            _STATS_WORKER = t
+
+
+def flush_variant_stats(timeout: Optional[float] = None) -> bool:
+    """Block until variant-stat updates queued so far are written. False on timeout."""
+    if _STATS_WORKER is None:
+        return True
+    marker = threading.Event()
+    _STATS_Q.put(marker)
+    return marker.wait(timeout)
+
+
+# Registered after close_all, so it runs first at exit (atexit is LIFO).
+atexit.register(flush_variant_stats)
+
+
+@lru_cache(maxsize=32)
+def _fetch_pending_sql(columns: Tuple[str, ...]) -> str:
+    unknown = set(columns) - set(MESSAGE_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown message columns: {sorted(unknown)}")
+    return f"SELECT {', '.join(columns)} FROM messages WHERE status=? LIMIT ?"
+
+
+def fetch_pending(dbpath: Path, status: str = "approved", limit: int = 100, columns: Sequence[str] = MESSAGE_COLUMNS) -> List[Dict]:
+    """Messages with `status` as dicts holding only `columns` (default: all).
+
+    Pass a narrower column list (e.g. ("id",)) to avoid copying subject/body.
+    """
+    columns = tuple(columns)
+    cur = _connect(dbpath).cursor()
+    cur.execute(_fetch_pending_sql(columns), (status, limit))
+    return [dict(zip(columns, r)) for r in cur.fetchall()]
+
+
+_SQL_CHANNEL_ROLLUP = """
+SELECT m.channel, SUM(m.status='sent'), COALESCE(SUM(r.n), 0)
+FROM messages m
+LEFT JOIN (
+    SELECT message_id, COUNT(*) AS n FROM events WHERE kind='replied' GROUP BY message_id
+) r ON r.message_id = m.id
+GROUP BY m.channel
+"""
+# Sent messages per variant with the opens/replies/meetings logged against
+# them; groups come out in order of each variant's first sent message.
+_SQL_VARIANT_ROLLUP = """
+SELECT m.variant_set, m.variant_id, COUNT(*),
+       COALESCE(SUM(e.opens), 0), COALESCE(SUM(e.replies), 0), COALESCE(SUM(e.meetings), 0)
+FROM messages m
+LEFT JOIN (
+    SELECT message_id,
+           SUM(kind='opened') AS opens,
+           SUM(kind='replied') AS replies,
+           SUM(kind IN ('meeting', 'booked_meeting')) AS meetings
+    FROM events WHERE message_id IS NOT NULL GROUP BY message_id
+) e ON e.message_id = m.id
+WHERE m.status='sent' AND m.variant_id IS NOT NULL AND m.variant_id != ''
+GROUP BY m.variant_set, m.variant_id
+ORDER BY MIN(m.rowid)
+"""
+
+
+def channel_rollup(dbpath: Path) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """(sent messages, replied events) per channel, omitting zero counts."""
+    contacted: Dict[str, int] = {}
+    replies: Dict[str, int] = {}
+    for channel, n_sent, n_replies in _connect(dbpath).execute(_SQL_CHANNEL_ROLLUP).fetchall():
+        if n_sent:
+            contacted[channel] = int(n_sent)
+        if n_replies:
+            replies[channel] = int(n_replies)
+    return contacted, replies
+
+
+def variant_rollup(dbpath: Path) -> List[Dict]:
+    """Per-variant sent/opens/replies/meetings for sent messages that carry a variant_id."""
+    keys = ("variant_set", "variant_id", "sent", "opens", "replies", "meetings")
+    return [dict(zip(keys, r)) for r in _connect(dbpath).execute(_SQL_VARIANT_ROLLUP).fetchall()]
 
 
 def last_reply_ts(dbpath: Path) -> Optional[datetime]:
-    init_db(dbpath)
+    """Time of the newest 'replied' event as a naive UTC datetime, or None."""
     conn = _connect(dbpath)
     cur = conn.cursor()
-    cur.execute("SELECT ts FROM events WHERE kind='replied' ORDER BY ts DESC LIMIT 1")
+    cur.execute(_SQL_LAST_REPLY)
     row = cur.fetchone()
-    conn.close()
     if not row:
         return None
-    return datetime.fromisoformat(row[0])
+    ts_us, ts = row
+    if ts_us is None:
+        # ts text that SQLite could not parse during the ts_us backfill
+        return datetime.fromisoformat(ts)
+    return _EPOCH + ts_us * _US
@@ -1,29 +1,55 @@
 from __future__ import annotations
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 import json
+import os
 import yaml
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
 from ada.learning.variants import Variant
 
+# libyaml's C loader when PyYAML was built with it; same results as safe_load
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_SUFFIXES = (".yml", ".yaml", ".json")
+
+# Parsed libraries per directory: key -> (stamp, variant_set -> variants).
+# The stamp is the directory's mtime (files added/removed/renamed) plus the
+# newest library file mtime (files edited in place).
+_LIB_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, List[Variant]]]] = {}
+
+
+def _library_files(path: Path) -> List[os.DirEntry]:
+    # Name order, as sorted(path.glob("*")) gave: a later file wins a variant_set clash
+    with os.scandir(path) as it:
+        entries = [e for e in it if os.path.splitext(e.name)[1].lower() in _SUFFIXES and e.is_file()]
+    entries.sort(key=lambda e: e.name)
+    return entries
+
 
 def load_library(path: Path) -> Dict[str, List[Variant]]:
     """Load all YAML/JSON files in a templates/library directory and return mapping
     of variant_set -> list[Variant]. Files may contain a top-level 'variant_set'
     or default to filename (without ext).
     """
-    libs: Dict[str, List[Variant]] = {}
     path.mkdir(parents=True, exist_ok=True)
-    for p in sorted(path.glob("*")):
-        if not p.is_file():
-            continue
+    key = str(path.resolve())
+    entries = _library_files(path)
+    stamp = (path.stat().st_mtime_ns, max((e.stat().st_mtime_ns for e in entries), default=0))
+    hit = _LIB_CACHE.get(key)
+    if hit is not None and hit[0] == stamp:
+        return {vs: list(variants) for vs, variants in hit[1].items()}
+    libs: Dict[str, List[Variant]] = {}
+    for e in entries:
+        stem, suffix = os.path.splitext(e.name)
         try:
-            if p.suffix.lower() in (".yml", ".yaml"):
-                payload = yaml.safe_load(p.read_text(encoding="utf-8")) or {}
-            elif p.suffix.lower() == ".json":
-                payload = json.loads(p.read_text(encoding="utf-8"))
+            raw = Path(e.path).read_bytes()
+            if suffix.lower() == ".json":
+                payload = _orjson.loads(raw) if _orjson is not None else json.loads(raw)
             else:
-                continue
-            vs = payload.get("variant_set") or p.stem
+                payload = yaml.load(raw.decode("utf-8"), Loader=_YAML_LOADER) or {}
+            vs = payload.get("variant_set") or stem
             variants = []
             for v in payload.get("variants", []):
                 variants.append(Variant(**v))
@@ -31,7 +57,8 @@ def load_library(path: Path) -> Dict[str, List[Variant]]:
         except Exception:
             # skip invalid files but continue
             continue
-    return libs
+    _LIB_CACHE[key] = (stamp, libs)
+    return {vs: list(variants) for vs, variants in libs.items()}
 
 
 def get_variants_for_set(path: Path, variant_set: str):
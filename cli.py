@@ -1,5 +1,6 @@
 from __future__ import annotations
-import argparse, os
+import argparse, csv, itertools, time, traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import pandas as pd
 from rich import print
@@ -23,44 +24,105 @@ def cmd_owners(args):
     for o in owners:
         print({"id": o.get("id"), "email": o.get("email"), "firstName": o.get("firstName"), "lastName": o.get("lastName")})
 
-def _pull_contacts(limit: int, out_path: Path) -> int:
+# Column types for contacts.csv as written by _pull_contacts. Declaring them
+# skips read_csv's per-column type inference; ids stay strings (HubSpot ids
+# are opaque) and the handful of lifecycle stages share one category table.
+CONTACTS_DTYPES = {
+    "id": "string",
+    "email": "string",
+    "firstName": "string",
+    "lastName": "string",
+    "lifecyclestage": "category",
+    "ownerId": "string",
+    "lastmodifieddate": "string",
+}
+
+try:
+    import pyarrow as _pa
+    import pyarrow.csv as _pa_csv
+    from pandas._libs.parsers import STR_NA_VALUES as _NA_VALUES
+    _CSV_ENGINE = "pyarrow"
+except Exception:
+    _CSV_ENGINE = "c"
+
+def _read_contacts_arrow(path: Path) -> pd.DataFrame:
+    """Multi-threaded pyarrow read that yields the same frame as the C engine.
+
+    pandas' own engine="pyarrow" infers column types first (turning
+    lastmodifieddate into timestamps, "007" ids into 7) and only then applies
+    dtype, so the declared columns are read as plain strings here instead,
+    with pandas' default NA markers.
+    """
+    convert = _pa_csv.ConvertOptions(
+        column_types={name: _pa.string() for name in CONTACTS_DTYPES},
+        null_values=sorted(_NA_VALUES),
+        strings_can_be_null=True,
+    )
+    frame = _pa_csv.read_csv(path, convert_options=convert).to_pandas()
+    dtypes = {k: v for k, v in CONTACTS_DTYPES.items() if k in frame.columns}
+    # read_csv builds categories from object values; starting from str would
+    # give an all-NA column str-typed empty categories on pandas 3
+    cats = [k for k, v in dtypes.items() if v == "category"]
+    return frame.astype(dict.fromkeys(cats, object)).astype(dtypes)
+
+def _read_contacts(path: Path) -> pd.DataFrame:
+    if _CSV_ENGINE == "pyarrow":
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            header = next(csv.reader(f), [])
+        # Only columns with a declared dtype are read as text; anything else
+        # would go through pyarrow's inference, so leave it to the C parser.
+        if header and len(set(header)) == len(header) and set(header) <= CONTACTS_DTYPES.keys():
+            try:
+                return _read_contacts_arrow(path)
+            except Exception:
+                # e.g. ragged rows that the C parser still accepts
+                pass
+    return pd.read_csv(path, dtype=CONTACTS_DTYPES)
+
+_CONTACT_FIELDS = ["id", "email", "firstName", "lastName", "lifecyclestage", "ownerId", "lastmodifieddate"]
+
+def _pull_contacts(limit: int, out_path: Path, token: str | None = None) -> int:
     # Request a very small, safe set of properties to avoid API errors
     # caused by requesting properties that don't exist in the target
     # HubSpot account. If you need owner load and lastmodifieddate in
     # reports, we can fetch them in a follow-up call per-contact
     # (but keep initial requests conservative for CI reliability).
     props = ["email", "firstname", "lastname", "lifecyclestage"]
-    rows = []
-    for c in hubspot.stream_contacts(max_total=limit, properties=props):
-        p = c.get("properties", {}) or {}
-        rows.append({
-            "id": c.get("id"),
-            "email": p.get("email"),
-            "firstName": p.get("firstname"),
-            "lastName": p.get("lastname"),
-            "lifecyclestage": p.get("lifecyclestage"),
-            "ownerId": p.get("hubspot_owner_id"),
-            "lastmodifieddate": p.get("lastmodifieddate"),
-        })
-    pd.DataFrame(rows).to_csv(out_path, index=False)
-    return len(rows)
+    n = 0
+    # Rows go straight to disk as they stream in; nothing is held in memory
+    with out_path.open("w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(_CONTACT_FIELDS)
+        for c in hubspot.stream_contacts(max_total=limit, properties=props, token=token):
+            p = c.get("properties", {}) or {}
+            writer.writerow((
+                c.get("id"),
+                p.get("email"),
+                p.get("firstname"),
+                p.get("lastname"),
+                p.get("lifecyclestage"),
+                p.get("hubspot_owner_id"),
+                p.get("lastmodifieddate"),
+            ))
+            n += 1
+    return n
 
 def cmd_pull_contacts(args):
     out = Path(args.out or "contacts.csv")
     n = _pull_contacts(limit=int(args.limit), out_path=out)
     print(f"[green]Wrote {n} contacts → {out}")
 
-def _analyze_csv(csv_path: Path, out_dir: Path, *, pure_html: bool = False) -> None:
-    df = pd.read_csv(csv_path)
+def _analyze_csv(csv_path: Path, out_dir: Path, *, pure_html: bool = False, scores_format: str = "jsonl") -> None:
+    df = _read_contacts(csv_path)
     df = score_contacts(df)
     _ = owner_rollup(df)
-    write_outputs(df, str(out_dir), pure_html=pure_html)
+    write_outputs(df, str(out_dir), pure_html=pure_html, scores_format=scores_format)
     print(f"[green]Reports written to {out_dir}")
 
 def cmd_analyze(args):
     if args.source != "csv":
         raise SystemExit("Only --source csv is currently supported.")
-    _analyze_csv(Path(args.path), Path(args.out_dir), pure_html=bool(args.pure_html))
+    _analyze_csv(Path(args.path), Path(args.out_dir), pure_html=bool(args.pure_html), scores_format=args.scores_format)
 
 def _run_audit_for_client(c: ClientConfig, limit: int, out_root: Path, skip_pull: bool, *, pure_html: bool = False) -> None:
     c_dir = out_root / c.slug
@@ -70,25 +132,20 @@ def _run_audit_for_client(c: ClientConfig, limit: int, out_root: Path, skip_pull
         # to the global HUBSPOT_TOKEN. This prevents placeholder or
         # malformed per-client tokens in `clients.toml` from breaking the
         # whole audit. We validate by calling a lightweight owners check.
-        original_token = os.getenv("HUBSPOT_TOKEN")
-        used_per_client_token = False
+        # The token is passed explicitly (never via os.environ) so audits
+        # for several clients can run concurrently.
+        token = None
         if c.hubspot_token:
-            os.environ["HUBSPOT_TOKEN"] = c.hubspot_token
             try:
                 # lightweight validation; will raise on auth/permission errors
-                hubspot.list_owners()
-                used_per_client_token = True
+                hubspot.list_owners(token=c.hubspot_token)
+                token = c.hubspot_token
                 print(f"[blue]Using per-client HubSpot token for {c.slug}")
             except Exception as e:
-                # Restore original and continue with global token
-                if original_token is not None:
-                    os.environ["HUBSPOT_TOKEN"] = original_token
-                else:
-                    os.environ.pop("HUBSPOT_TOKEN", None)
                 print(f"[yellow]Per-client token for {c.slug} failed validation, falling back to global token: {e}")
         contacts_csv = c_dir / "contacts.csv"
         if not skip_pull:
-            n = _pull_contacts(limit=limit, out_path=contacts_csv)
+            n = _pull_contacts(limit=limit, out_path=contacts_csv, token=token)
             print(f"[blue]{c.name}: downloaded {n} contacts")
         else:
             if not contacts_csv.exists():
@@ -97,7 +154,6 @@ def _run_audit_for_client(c: ClientConfig, limit: int, out_root: Path, skip_pull
     except Exception as e:
         # Write a full traceback to the per-client error file for easier
         # debugging in CI; also print a short message to the console.
-        import traceback
         tb = traceback.format_exc()
         # If this was a HubSpot listing failure, append actionable
         # troubleshooting guidance so the CI artifact is helpful to users.
@@ -112,16 +168,6 @@ def _run_audit_for_client(c: ClientConfig, limit: int, out_root: Path, skip_pull
             )
         (c_dir / "error.txt").write_text(tb + guidance, encoding="utf-8")
         print(f"[red]Audit FAILED for {c.name} ({c.slug}) → {type(e).__name__}: {e}")
-    finally:
-        # Ensure we restore the original HUBSPOT_TOKEN after the client run
-        try:
-            if 'original_token' in locals():
-                if original_token is not None:
-                    os.environ["HUBSPOT_TOKEN"] = original_token
-                else:
-                    os.environ.pop("HUBSPOT_TOKEN", None)
-        except Exception:
-            pass
 
 def cmd_audit(args):
     clients = load_clients(args.config)
@@ -129,9 +175,15 @@ def cmd_audit(args):
     if args.client and args.all:
         raise SystemExit("Use either --client <slug> or --all (not both).")
     targets = clients if args.all else [get_client(clients, args.client)]
-    for c in targets:
+
+    def audit(c: ClientConfig) -> None:
         print(f"[bold]Auditing: {c.name} ({c.slug})[/bold]")
         _run_audit_for_client(c, limit=int(args.limit), out_root=out_root, skip_pull=bool(args.skip_pull), pure_html=bool(args.pure_html))
+
+    # Audits are dominated by HubSpot round-trips, so clients run side by side
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(targets)))) as pool:
+        for f in [pool.submit(audit, c) for c in targets]:
+            f.result()
     if args.all:
         render_master_index(clients, out_root, out_root / "index.html")
         print(f"[green]Master dashboard written → {out_root / 'index.html'}")
@@ -196,16 +248,15 @@ def cmd_outreach_draft(args):
         contacts_map = {}
         csvp = c_dir / "contacts.csv"
         if csvp.exists():
-            import pandas as pd
-            df = pd.read_csv(csvp)
-            # Replace NaN with None so Pydantic Optional[str]/float fields validate
-            # correctly when we construct schema models from CSV rows.
-            df = df.where(pd.notnull(df), None)
-            for _, r in df.iterrows():
-                contacts_map[str(r.get('id'))] = r.to_dict()
+            df = _read_contacts(csvp)
+            # Replace NaN/NA with None so Pydantic Optional[str]/float fields validate
+            # correctly when we construct schema models from CSV rows. Done once
+            # for the whole frame (object dtype so None is kept as-is).
+            df = df.astype(object).where(df.notna(), None)
+            for rec in df.to_dict('records'):
+                contacts_map[str(rec.get('id'))] = rec
         dbpath = c_dir / "outbox.sqlite"
         store.init_db(dbpath)
-        count = 0
         # Prepare connector (fail fast and record connector error for dashboard)
         try:
             connector = _mail_connector_for_client(c)
@@ -213,62 +264,59 @@ def cmd_outreach_draft(args):
             (c_dir / "connector_error.txt").write_text(str(e), encoding="utf-8")
             print(f"[yellow]Skipping drafts for {c.slug}: {e}")
             continue
-        for cid in plan.get('targets', [])[: int(args.limit)]:
-            info = contacts_map.get(cid, {})
-            # Guard against pandas NaN values coming from CSV by converting them to None
-            def _clean(v):
-                try:
-                    import pandas as pd  # type: ignore
-                    return None if pd.isna(v) else v
-                except Exception:
+        # Drafts are written in one transaction at the end (or on error, so
+        # anything already drafted is still persisted).
+        drafts: list[schemas.Message] = []
+        # Per-client invariants, resolved once rather than per contact
+        brand_voice = getattr(c, 'brand_voice', None)
+        variant_set = getattr(args, 'variant_set', 'baseline')
+        try:
+            variant_defs = get_variants_for_set(Path('ada/templates/library'), variant_set)
+        except Exception:
+            variant_defs = []
+        try:
+            for cid in plan.get('targets', [])[: int(args.limit)]:
+                info = contacts_map.get(cid, {})
+                contact = schemas.Contact(
+                    id=cid,
+                    email=info.get('email'),
+                    first_name=info.get('firstName'),
+                    last_name=info.get('lastName'),
+                    owner_id=info.get('ownerId'),
+                    lifecycle=info.get('lifecyclestage'),
+                    last_modified=None,
+                    score=None,
+                )
+                # default render
+                subj, body = templates.render(contact, brand_voice)
+                # If variant templates exist for this client/variant-set, choose and render per-contact
+                chosen_variant = None
+                if variant_defs:
                     try:
-                        import math
-                        return None if isinstance(v, float) and math.isnan(v) else v
+                        chosen_variant = variants_engine.choose_variant(variant_defs, Path(args.out_root or 'audits'), c.slug, variant_set)
+                        if chosen_variant:
+                            subj, body = templates.render_variant(contact, chosen_variant)
                     except Exception:
-                        return v
-            contact = schemas.Contact(
-                id=cid,
-                email=_clean(info.get('email')),
-                first_name=_clean(info.get('firstName')),
-                last_name=_clean(info.get('lastName')),
-                owner_id=_clean(info.get('ownerId')),
-                lifecycle=_clean(info.get('lifecyclestage')),
-                last_modified=None,
-                score=None,
-            )
-            # default render
-            subj, body = templates.render(contact, getattr(c, 'brand_voice', None))
-            # If variant templates exist for this client/variant-set, choose and render per-contact
-            variant_set = getattr(args, 'variant_set', 'baseline')
-            try:
-                variant_defs = get_variants_for_set(Path('ada/templates/library'), variant_set)
-            except Exception:
-                variant_defs = []
-            chosen_variant = None
-            if variant_defs:
+                        chosen_variant = None
+
+                # create draft message and save
                 try:
-                    chosen_variant = variants_engine.choose_variant(variant_defs, Path(args.out_root or 'audits'), c.slug, variant_set)
-                    if chosen_variant:
-                        subj, body = templates.render_variant(contact, chosen_variant)
+                    m = connector.draft(subj, body, contact.email or cid)
+                except Exception as e:
+                    print(f"[red]Failed to draft for {cid}: {e}")
+                    continue
+                # annotate message meta with variant info for learning
+                try:
+                    if chosen_variant is not None:
+                        m.meta = m.meta or {}
+                        m.meta['variant_id'] = chosen_variant.id
+                        m.meta['variant_set'] = variant_set
                 except Exception:
-                    chosen_variant = None
-
-            # create draft message and save
-            try:
-                m = connector.draft(subj, body, contact.email or cid)
-            except Exception as e:
-                print(f"[red]Failed to draft for {cid}: {e}")
-                continue
-            # annotate message meta with variant info for learning
-            try:
-                if chosen_variant is not None:
-                    m.meta = m.meta or {}
-                    m.meta['variant_id'] = chosen_variant.id
-                    m.meta['variant_set'] = variant_set
-            except Exception:
-                pass
-            store.save_message(dbpath, m)
-            count += 1
+                    pass
+                drafts.append(m)
+        finally:
+            store.save_messages(dbpath, drafts)
+        count = len(drafts)
         print(f"[green]{c.slug}: drafted {count} messages")
 
 
@@ -285,15 +333,35 @@ def cmd_outreach_approve(args):
         # Support CSV via --ids
         if getattr(args, 'ids', None):
             ids.extend([s.strip() for s in (args.ids or '').split(',') if s.strip()])
-        if args.all:
-            rows = store.fetch_pending(dbpath, status="draft", limit=10000)
-            ids = [r['id'] for r in rows]
         # Enforce per-client approval cap
         cap =  int(getattr(c, 'overrides', {}).get('daily_cap', 25) if getattr(c, 'overrides', None) else 25)
-        ids = ids[:cap]
-        for mid in ids:
-            store.update_status(dbpath, mid, "approved")
-        print(f"[green]{c.slug}: approved {len(ids)} messages")
+        # --all approves the oldest drafts up to the cap in a single UPDATE
+        n = store.approve_messages(dbpath, None if args.all else ids, limit=cap)
+        print(f"[green]{c.slug}: approved {n} messages")
+
+
+# Millisecond timestamps alone collide within a send/replies batch (and the
+# events table replaces on id), so ids pair a ns clock with a process counter.
+_EV_SEQ = itertools.count()
+
+
+def _event_id() -> str:
+    return f"ev_{time.time_ns()}_{next(_EV_SEQ)}"
+
+
+# Delivered messages are written back at least this often, so a killed run
+# leaves a bounded number of sent messages still marked approved (and re-sent).
+_SEND_FLUSH_EVERY = 100
+# Messages per connector.send_batch call (one sent_at stamp per batch)
+_SEND_BATCH = 10
+
+
+def _flush_sent(dbpath: Path, msgs: list[schemas.Message], evs: list[schemas.Event]) -> None:
+    """Save sent messages and log their events (one transaction each), then clear both lists."""
+    store.save_messages(dbpath, msgs)
+    store.log_events(dbpath, evs)
+    msgs.clear()
+    evs.clear()
 
 
 def cmd_outreach_send(args):
@@ -320,25 +388,54 @@ def cmd_outreach_send(args):
             cfg.update(c.overrides)
         channel = cfg.get('channel', 'gmail')
         cap = int(cfg.get(f'{channel}_cap', cfg.get('daily_cap', 25)))
+        # Sends are network-bound, so up to send_concurrency send_batch calls run
+        # at once. Results are recorded as each batch completes; sent messages
+        # are written back, and their 'sent' events logged, every
+        # _SEND_FLUSH_EVERY sends and on the way out, so completed sends are
+        # kept even on error.
+        msgs: list[schemas.Message] = []
         for row in pending[:cap]:
-            msg = schemas.Message(**{k: row[k] for k in row.keys() if k in row})
-            try:
-                updated = connector.send(msg)
-                store.save_message(dbpath, updated)
-                # Log a 'sent' event with channel context
-                ev = schemas.Event(
-                    id=f"ev_{int(datetime.utcnow().timestamp()*1000)}",
-                    client_slug=c.slug,
-                    kind="sent",
-                    contact_id=updated.contact_id,
-                    message_id=updated.id,
-                    ts=datetime.utcnow(),
-                    meta={"channel": updated.channel},
-                )
-                store.log_event(dbpath, ev)
-                sent += 1
-            except Exception as e:
-                store.update_status(dbpath, msg.id, "failed", {"error": str(e)})
+            # meta is stored as JSON text
+            row["meta"] = json.loads(row["meta"] or "{}") if isinstance(row.get("meta"), str) else (row.get("meta") or {})
+            msgs.append(schemas.Message(**row))
+        sent_msgs: list[schemas.Message] = []
+        sent_evs: list[schemas.Event] = []
+        workers = max(1, int(cfg.get("send_concurrency", 5)))
+        batches = [msgs[i:i + _SEND_BATCH] for i in range(0, len(msgs), _SEND_BATCH)]
+        try:
+            with ThreadPoolExecutor(max_workers=min(workers, len(batches) or 1)) as pool:
+                futures = {pool.submit(connector.send_batch, batch): batch for batch in batches}
+                try:
+                    for fut in as_completed(futures):
+                        try:
+                            updated_batch = fut.result()
+                        except Exception as e:
+                            # Which of the batch went out is unknown; failed ones aren't re-sent
+                            store.update_statuses(dbpath, [m.id for m in futures[fut]], "failed", {"error": str(e)})
+                            continue
+                        # Delivered: a store error below must not mark them failed
+                        now = datetime.utcnow()
+                        for updated in updated_batch:
+                            sent_msgs.append(updated)
+                            # Log a 'sent' event with channel context
+                            sent_evs.append(schemas.Event(
+                                id=_event_id(),
+                                client_slug=c.slug,
+                                kind="sent",
+                                contact_id=updated.contact_id,
+                                message_id=updated.id,
+                                ts=now,
+                                meta={"channel": updated.channel},
+                            ))
+                        sent += len(updated_batch)
+                        if len(sent_msgs) >= _SEND_FLUSH_EVERY:
+                            _flush_sent(dbpath, sent_msgs, sent_evs)
+                except BaseException:
+                    # Don't start sends whose results could no longer be recorded
+                    pool.shutdown(cancel_futures=True)
+                    raise
+        finally:
+            _flush_sent(dbpath, sent_msgs, sent_evs)
         print(f"[green]{c.slug}: sent {sent} messages")
 
 
@@ -358,11 +455,12 @@ def cmd_outreach_replies(args):
             print(f"[yellow]Gmail connector not configured for {c.slug}: {e}")
             continue
         replies = conn.list_replies(since)
-        cnt = 0
-        for r in replies:
-            ev = schemas.Event(id=f"ev_{int(datetime.utcnow().timestamp()*1000)}", client_slug=c.slug, kind="replied", contact_id=r.contact_id, message_id=r.id, ts=datetime.utcnow(), meta={"channel": r.channel})
-            store.log_event(out_root / c.slug / "outbox.sqlite", ev)
-            cnt += 1
+        evs = [
+            schemas.Event(id=_event_id(), client_slug=c.slug, kind="replied", contact_id=r.contact_id, message_id=r.id, ts=datetime.utcnow(), meta={"channel": r.channel})
+            for r in replies
+        ]
+        store.log_events(dbpath, evs)
+        cnt = len(evs)
         print(f"[green]{c.slug}: logged {cnt} replies")
 
 
@@ -375,59 +473,11 @@ def cmd_outreach_metrics(args):
         if not dbpath.exists():
             print(f"[yellow]No outbox for {c.slug}")
             continue
-        # roll up basic counts from events table
-        import sqlite3
-        p = dbpath
-        conn = sqlite3.connect(str(p))
-        cur = conn.cursor()
-        # by-channel contacted (sent messages)
-        cur.execute("SELECT channel, COUNT(*) FROM messages WHERE status='sent' GROUP BY channel")
-        by_channel_contacted = {row[0]: int(row[1]) for row in cur.fetchall()}
-        # by-channel replies (join with messages)
-        cur.execute("""
-            SELECT m.channel, COUNT(*)
-            FROM events e
-            JOIN messages m ON m.id = e.message_id
-            WHERE e.kind='replied'
-            GROUP BY m.channel
-        """)
-        by_channel_replies = {row[0]: int(row[1]) for row in cur.fetchall()}
+        # Both rollups are single aggregate queries on the cached store connection
+        by_channel_contacted, by_channel_replies = store.channel_rollup(dbpath)
         contacted = sum(by_channel_contacted.values())
         replies = sum(by_channel_replies.values())
-        # Variant-level rollups: read messages and events and attribute to variant_id in meta
-        cur.execute("SELECT id, meta FROM messages WHERE status='sent'")
-        variant_counters = {}
-        msg_variant = {}
-        for mid, meta_text in cur.fetchall():
-            try:
-                meta = json.loads(meta_text or "{}")
-            except Exception:
-                meta = {}
-            vid = meta.get('variant_id')
-            vset = meta.get('variant_set', 'baseline')
-            key = (vset, vid)
-            msg_variant[mid] = key
-            if vid:
-                variant_counters.setdefault(key, {'variant_set': vset, 'variant_id': vid, 'sent': 0, 'opens': 0, 'replies': 0, 'meetings': 0})
-                variant_counters[key]['sent'] += 1
-
-        # scan events for opens/replies/meetings and attribute by message->variant
-        cur.execute("SELECT kind, message_id FROM events")
-        for kind, mid in cur.fetchall():
-            key = msg_variant.get(mid)
-            if not key:
-                continue
-            counters = variant_counters.get(key)
-            if not counters:
-                continue
-            if kind == 'replied':
-                counters['replies'] += 1
-            elif kind == 'opened':
-                counters['opens'] += 1
-            elif kind in ('meeting', 'booked_meeting'):
-                counters['meetings'] += 1
-
-        conn.close()
+        variant_perf = store.variant_rollup(dbpath)
         metrics = {
             "client_slug": c.slug,
             "window": "day",
@@ -443,7 +493,7 @@ def cmd_outreach_metrics(args):
             "replies_by_channel": by_channel_replies,
             "meetings_by_channel": {},
             # variant-level performance
-            "variant_perf": list(variant_counters.values()),
+            "variant_perf": variant_perf,
         }
         (out_root / c.slug / "outreach_metrics.json").write_text(json.dumps(metrics, indent=2), encoding="utf-8")
         print(f"[green]{c.slug}: metrics written (contacted={contacted}, replies={replies})")
@@ -459,6 +509,7 @@ def main():
     p2.add_argument("--path", required=True)
     p2.add_argument("--out-dir", default="reports")
     p2.add_argument("--pure-html", action="store_true", help="Write summary.html using a pure-HTML fallback (no markdown conversion)")
+    p2.add_argument("--scores-format", choices=["jsonl", "parquet"], default="jsonl", help="Format of the lead_scores export next to lead_scores.csv")
     p2.set_defaults(func=cmd_analyze)
     p3 = sub.add_parser("audit", help="Consultant Mode: multi-client batch audits")
     scope = p3.add_mutually_exclusive_group(required=True)
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+from ada.analysis import _pct_rank, owner_rollup, score_contacts
+
+
+def test_pct_rank_matches_pandas_rank():
+    s = pd.to_datetime(pd.Series([
+        "2025-01-03", None, "2025-01-01", "2025-01-03", "not a date", "2025-01-02",
+    ]), errors="coerce")
+    expected = s.rank(pct=True).fillna(0).to_numpy()
+    np.testing.assert_allclose(_pct_rank(s.values.view("i8")), expected)
+
+
+def test_score_contacts_bounds_and_lifecycle():
+    df = pd.DataFrame({
+        "id": [1, 2, 3],
+        "email": ["a@x.com", "", "c@x.com"],
+        "ownerId": ["o1", "", "o2"],
+        "lifecyclestage": ["customer", "lead", "SalesQualifiedLead"],
+        "lastmodifieddate": ["2025-01-01", "2025-01-02", "2025-01-03"],
+    })
+    out = score_contacts(df)
+    assert "lead_score" not in df.columns
+    assert out["lead_score"].between(0, 100).all()
+    # id 2 has no email/owner/lifecycle boost: only its recency share remains
+    assert out["lead_score"].tolist() == pytest.approx([73.33, 26.67, 100.0])
+
+
+def test_owner_rollup_sorted_path_matches_groupby():
+    df = pd.DataFrame({
+        "id": [1, 2, 3, 4, 5],
+        "ownerId": ["a", "a", "b", "c", "c"],
+        "lead_score": [10.0, 30.0, 50.0, 40.0, 10.0],
+    })
+    fast = owner_rollup(df).reset_index(drop=True)
+    slow = owner_rollup(df.iloc[::-1]).reset_index(drop=True)  # unsorted -> groupby path
+    assert fast["ownerId"].tolist() == slow["ownerId"].tolist() == ["b", "c", "a"]
+    assert fast["count"].tolist() == slow["count"].tolist() == [1, 2, 2]
+    assert fast["avg_score"].tolist() == slow["avg_score"].tolist() == [50.0, 25.0, 20.0]
+
+
+def test_owner_rollup_ties_break_on_owner_id():
+    df = pd.DataFrame({
+        "id": [1, 2, 3, 4, 5],
+        "ownerId": ["a", "b", "c", "d", "d"],
+        "lead_score": [20.0, 20.0, 20.0, 50.0, 50.0],
+    })
+    assert df["ownerId"].is_monotonic_increasing  # reduceat path
+    shuffled = df.iloc[[2, 0, 3, 1, 4]]
+    assert not shuffled["ownerId"].is_monotonic_increasing  # groupby path
+    for out in (owner_rollup(df), owner_rollup(shuffled)):
+        assert out["ownerId"].tolist() == ["d", "a", "b", "c"]
+        assert out["count"].tolist() == [2, 1, 1, 1]
+    # A missing owner ties last
+    with_missing = pd.concat([shuffled, pd.DataFrame({"id": [6], "ownerId": [None], "lead_score": [20.0]})])
+    out = owner_rollup(with_missing)
+    assert out["ownerId"].tolist()[:4] == ["d", "a", "b", "c"]
+    assert pd.isna(out["ownerId"].iloc[4])
@@ -0,0 +1,36 @@
+import pytest
+from ada.analysis import score_contacts
+from cli import _read_contacts
+
+
+def test_read_contacts_blank_cells_score(tmp_path):
+    csv_path = tmp_path / "contacts.csv"
+    csv_path.write_text(
+        "id,email,firstName,lastName,lifecyclestage,ownerId,lastmodifieddate\n"
+        "1,a@x.com,A,B,customer,o1,2025-01-01T00:00:00Z\n"
+        "2,,C,D,lead,,2025-01-02T00:00:00Z\n"
+        "3,c@x.com,E,F,,o2,2025-01-03T00:00:00Z\n",
+        encoding="utf-8",
+    )
+    out = score_contacts(_read_contacts(csv_path))
+    # blank email/ownerId cells are missing, which scores as "not empty"
+    assert out["lead_score"].tolist() == pytest.approx([73.33, 66.67, 80.0])
+
+
+def test_read_contacts_pyarrow_matches_c_engine(tmp_path):
+    pytest.importorskip("pyarrow")
+    import pandas as pd
+    from cli import CONTACTS_DTYPES, _read_contacts_arrow
+    csv_path = tmp_path / "contacts.csv"
+    csv_path.write_text(
+        "id,email,firstName,lastName,lifecyclestage,ownerId,lastmodifieddate\n"
+        "007,a@x.com,A,B,customer,0012,2025-01-01T00:00:00Z\n"
+        "2,,NA,\"Smith, Jr\",,,1700000000000\n"
+        "3,c@x.com,null,\"\",lead,o2,2025-01-03\n",
+        encoding="utf-8",
+    )
+    fast = _read_contacts_arrow(csv_path)
+    pd.testing.assert_frame_equal(fast, pd.read_csv(csv_path, dtype=CONTACTS_DTYPES))
+    # declared text columns keep their original text (no type inference)
+    assert fast["id"].tolist()[0] == "007"
+    assert fast["lastmodifieddate"].tolist()[0] == "2025-01-01T00:00:00Z"
@@ -45,4 +45,14 @@ def test_collect_metrics_and_render(tmp_path):
     txt = out.read_text()
     assert 'Alpha Co' in txt
     assert 'Beta LLC' in txt
-    assert 'alpha/summary.md' in txt or 'alpha/summary.html' in txt
\ No newline at end of file
+    assert 'alpha/summary.md' in txt or 'alpha/summary.html' in txt
+
+def test_render_escapes_client_values(tmp_path):
+    root = tmp_path / 'audits'
+    root.mkdir()
+    make_client_dir(root, 'gamma')
+    out = root / 'index.html'
+    render_master_index([ClientConfig(slug='gamma', name='<b>Gamma & Sons</b>')], root, out)
+    txt = out.read_text()
+    assert '&lt;b&gt;Gamma &amp; Sons&lt;/b&gt;' in txt
+    assert '<b>Gamma' not in txt
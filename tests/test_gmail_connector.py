@@ -24,3 +24,86 @@ def test_gmail_connector_draft_and_send():
     assert m.status == "draft"
     s = g.send(m)
     assert s.status == "sent"
+
+
+def test_gmail_draft_mime_round_trips():
+    import email
+    import email.policy
+    cfg = {
+        "gmail_user": "me@example.com",
+        "gmail_refresh_token": "refresh",
+        "gmail_client_id": "cid",
+        "gmail_client_secret": "secret",
+    }
+    g = GmailConnector(cfg)
+    # ASCII takes the string-built path, non-ASCII falls back to EmailMessage
+    for subject, body in [("Hello", "Line one\n\nLine two"), ("Héllo", "Grüße")]:
+        m = g.draft(subject, body, "you@example.com")
+        parsed = email.message_from_string(m.meta["mime"], policy=email.policy.default)
+        assert parsed["Subject"] == subject
+        assert parsed["To"] == "you@example.com"
+        assert parsed.get_content().rstrip("\n") == body
+
+
+def test_gmail_draft_ids_unique_in_tight_loop():
+    cfg = {
+        "gmail_user": "me@example.com",
+        "gmail_refresh_token": "refresh",
+        "gmail_client_id": "cid",
+        "gmail_client_secret": "secret",
+    }
+    g = GmailConnector(cfg)
+    ids = [g.draft("Hi", "Body", f"c{i}@example.com").id for i in range(1000)]
+    assert len(set(ids)) == len(ids)
+
+
+def test_gmail_fast_mime_matches_email_message():
+    from email.message import EmailMessage
+    from ada.connectors.gmail_mail import _fast_mime
+    cfg = {
+        "gmail_user": "me@example.com",
+        "gmail_refresh_token": "refresh",
+        "gmail_client_id": "cid",
+        "gmail_client_secret": "secret",
+    }
+    g = GmailConnector(cfg)
+    cases = [
+        ("Hello", "Line one\n\nLine two", True),
+        ("", "", True),
+        ("x" * 69, "y" * 78, True),  # both exactly at the 78-char limit
+        ("x" * 70, "Body", False),  # subject header must be folded
+        ("Long " * 20, "Body", False),
+        ("Hi", "y" * 79, False),  # body switches to quoted-printable
+        ("Hi", "short\n" + "z" * 500, False),
+        ("=?utf-8?q?x?=", "Body", False),
+        ("Héllo", "Grüße", False),
+    ]
+    for subject, body, fast in cases:
+        m = EmailMessage()
+        m["From"] = "me@example.com"
+        m["To"] = "you@example.com"
+        if subject:
+            m["Subject"] = subject
+        m.set_content(body)
+        expected = m.as_string()
+        out = _fast_mime(subject, body, "me@example.com", "you@example.com")
+        assert (out is not None) == fast
+        if fast:
+            assert out == expected
+        assert g.draft(subject, body, "you@example.com").meta["mime"] == expected
+
+
+def test_gmail_send_batch_shares_one_stamp():
+    cfg = {
+        "gmail_user": "me@example.com",
+        "gmail_refresh_token": "refresh",
+        "gmail_client_id": "cid",
+        "gmail_client_secret": "secret",
+    }
+    g = GmailConnector(cfg)
+    msgs = [g.draft("Hi", "Body", f"c{i}@example.com") for i in range(3)]
+    msgs[1].status = "sent"  # already sent: rejected, the rest still go out
+    out = g.send_batch(msgs)
+    assert [m.status for m in out] == ["sent", "failed", "sent"]
+    assert out[0].meta["sent_at"] == out[2].meta["sent_at"]
+    assert out[1].meta["error"] == "invalid-status-for-send"
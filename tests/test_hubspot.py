@@ -0,0 +1,39 @@
+import httpx
+import pytest
+from tenacity import wait_none
+from ada import hubspot
+
+
+def _mock_client(monkeypatch, handler, token="tok"):
+    client = httpx.Client(base_url=hubspot.API, transport=httpx.MockTransport(handler))
+    monkeypatch.setitem(hubspot._CLIENTS, token, client)
+    return token
+
+
+def test_list_contacts_does_not_retry_client_errors(monkeypatch):
+    calls = []
+
+    def handler(request):
+        calls.append((request.method, request.url.path))
+        return httpx.Response(400, json={"message": "Invalid request"})
+
+    token = _mock_client(monkeypatch, handler)
+    monkeypatch.setattr(hubspot.list_contacts.retry, "wait", wait_none())
+    with pytest.raises(RuntimeError):
+        hubspot.list_contacts(token=token)
+    assert calls.count(("GET", "/crm/v3/objects/contacts")) == 1
+
+
+def test_list_owners_retries_transient_errors(monkeypatch):
+    statuses = iter([429, 503])
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        status = next(statuses, 200)
+        return httpx.Response(status, json={"results": [{"id": "1"}]} if status == 200 else {})
+
+    token = _mock_client(monkeypatch, handler)
+    monkeypatch.setattr(hubspot.list_owners.retry, "wait", wait_none())
+    assert hubspot.list_owners(token=token) == [{"id": "1"}]
+    assert len(calls) == 3
@@ -24,3 +24,16 @@ def test_outlook_connector_draft_and_send():
     assert m.status == "draft"
     s = oc.send(m)
     assert s.status == "sent"
+
+
+def test_outlook_draft_ids_unique_in_tight_loop():
+    cfg = {
+        "outlook_user": "me@example.com",
+        "tenant_id": "t",
+        "client_id": "cid",
+        "client_secret": "secret",
+        "refresh_token": "refresh",
+    }
+    oc = OutlookConnector(cfg)
+    ids = [oc.draft("Hi", "Body", f"c{i}@example.com").id for i in range(1000)]
+    assert len(set(ids)) == len(ids)
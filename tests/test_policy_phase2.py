@@ -41,3 +41,16 @@ def test_domain_caps_and_blocklist():
     )
     # b@x.com should be blocked; y.com capped at 2 picks top 2 by score
     assert set(plan.targets) == {"1", "3", "4"}
+
+
+def test_allow_and_block_lists_ignore_case():
+    contacts = [mkc(1, "A@X.com", 3.0), mkc(2, "b@Y.com", 2.0), mkc(3, "c@z.com", 1.0)]
+    plan = build_plan(
+        "acme",
+        contacts,
+        daily_cap=10,
+        overrides={"allowlist": ["x.com", "Y.COM"], "blocklist": [" a@x.COM "]},
+        now=datetime(2025, 1, 1, 12, 0, 0),
+    )
+    assert plan.targets == ["2"]
+    assert plan.reasons_by_contact == {"1": "blocklisted", "3": "not-allowlisted"}
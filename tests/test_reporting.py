@@ -0,0 +1,18 @@
+import pandas as pd
+from ada.reporting import _dormant_mask
+
+
+def test_dormant_mask_parses_iso_epoch_and_other_formats():
+    now = pd.Timestamp.now(tz="UTC")
+    recent, old = now - pd.Timedelta(days=5), now - pd.Timedelta(days=400)
+    df = pd.DataFrame({"lastmodifieddate": [
+        recent.isoformat(),
+        str(int(recent.timestamp() * 1000)),  # epoch ms, as HubSpot may send
+        str(int(old.timestamp() * 1000)),
+        recent.strftime("%m/%d/%Y"),  # neither ISO nor epoch
+        None,
+        "not a date",
+    ]})
+    assert _dormant_mask(df).tolist() == [False, False, True, False, True, True]
+    as_string = df.astype({"lastmodifieddate": "string"})
+    assert _dormant_mask(as_string).tolist() == [False, False, True, False, True, True]
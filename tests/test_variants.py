@@ -1,4 +1,5 @@
 from pathlib import Path
+import random
 from ada.learning import variants as ve
 
 
@@ -24,9 +25,10 @@ def test_choose_variant_exploitation(tmp_path: Path):
     for _ in range(5):
         ve.record_event(db, "baseline", "B", "replied")
 
-    # With epsilon=0 (pure exploitation), B should be chosen
-    chosen2 = ve.choose_variant(pool, audits_root, slug, variant_set="baseline", epsilon=0.0)
-    assert chosen2.id == "B"
+    # Thompson sampling: B's Beta(6, 6) draw beats A's Beta(1, 11) almost always
+    random.seed(0)
+    picks = [ve.choose_variant(pool, audits_root, slug, variant_set="baseline", epsilon=0.0).id for _ in range(50)]
+    assert picks.count("B") >= 45
 
 
 def test_choose_variant_exploration_happens(tmp_path: Path):
@@ -46,3 +48,17 @@ def test_choose_variant_exploration_happens(tmp_path: Path):
         if len(seen) == 2:
             break
     assert seen == {"A", "B"}
+
+
+def test_record_events_matches_record_event(tmp_path: Path):
+    one = tmp_path / "one" / "learning.sqlite"
+    many = tmp_path / "many" / "learning.sqlite"
+    events = [("baseline", "A", "sent")] * 3 + [("baseline", "A", "replied"), ("baseline", "B", "open"), ("baseline", "", "sent")]
+    for ev in events:
+        ve.record_event(one, *ev)
+    ve.record_events(many, events)
+
+    def counts(db):
+        return [(r["variant_id"], r["sent"], r["opens"], r["replies"]) for r in ve.get_stats(db)]
+
+    assert counts(many) == counts(one) == [("A", 3, 0, 1), ("B", 0, 1, 0)]